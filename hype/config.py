@@ -4,6 +4,101 @@ from typing import List
 
 import yaml
 
+# Prefer the libyaml-backed parser when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _load_yaml(path: str):
+    """Parse a YAML config file."""
+    with open(path, "r") as configfile:
+        return yaml.load(configfile, Loader=_YAML_LOADER)
+
+
+# Scalar settings resolved as HYPE_* env var -> config.yaml key -> class default
+_ENV_SPEC = (
+    ("HYPE_INTERVAL", "interval", int),
+    ("HYPE_LOG_LEVEL", "log_level", str),
+    ("HYPE_DEBUG_DECISIONS", "debug_decisions", bool),
+    ("HYPE_LOGFILE_PATH", "logfile_path", str),
+    ("HYPE_PROFILE_PREFIX", "profile_prefix", str),
+    ("HYPE_DAILY_PUBLIC_CAP", "daily_public_cap", int),
+    ("HYPE_PER_HOUR_PUBLIC_CAP", "per_hour_public_cap", int),
+    ("HYPE_MAX_BOOSTS_PER_RUN", "max_boosts_per_run", int),
+    ("HYPE_MAX_BOOSTS_PER_AUTHOR_PER_DAY", "max_boosts_per_author_per_day", int),
+    ("HYPE_AUTHOR_DIVERSITY_ENFORCED", "author_diversity_enforced", bool),
+    ("HYPE_REQUIRE_MEDIA", "require_media", bool),
+    ("HYPE_SKIP_SENSITIVE_WITHOUT_CW", "skip_sensitive_without_cw", bool),
+    ("HYPE_MIN_REBLOGS", "min_reblogs", int),
+    ("HYPE_MIN_FAVOURITES", "min_favourites", int),
+    ("HYPE_MIN_REPLIES", "min_replies", int),
+    ("HYPE_LANGUAGES_ALLOWLIST", "languages_allowlist", list),
+    ("HYPE_USE_MASTODON_LANGUAGE_DETECTION", "use_mastodon_language_detection", bool),
+    ("HYPE_STATE_PATH", "state_path", str),
+    ("HYPE_SEEN_CACHE_SIZE", "seen_cache_size", int),
+    ("HYPE_AGE_DECAY_ENABLED", "age_decay_enabled", bool),
+    ("HYPE_AGE_DECAY_HALF_LIFE_HOURS", "age_decay_half_life_hours", float),
+    ("HYPE_HASHTAG_DIVERSITY_ENFORCED", "hashtag_diversity_enforced", bool),
+    ("HYPE_MAX_BOOSTS_PER_HASHTAG_PER_RUN", "max_boosts_per_hashtag_per_run", int),
+    ("HYPE_SPAM_EMOJI_PENALTY", "spam_emoji_penalty", float),
+    ("HYPE_SPAM_EMOJI_THRESHOLD", "spam_emoji_threshold", int),
+    ("HYPE_SPAM_LINK_PENALTY", "spam_link_penalty", float),
+    ("HYPE_MIN_SCORE_THRESHOLD", "min_score_threshold", float),
+    ("HYPE_LOCAL_TIMELINE_ENABLED", "local_timeline_enabled", bool),
+    ("HYPE_LOCAL_TIMELINE_FETCH_LIMIT", "local_timeline_fetch_limit", int),
+    ("HYPE_LOCAL_TIMELINE_BOOST_LIMIT", "local_timeline_boost_limit", int),
+    ("HYPE_LOCAL_TIMELINE_MIN_ENGAGEMENT", "local_timeline_min_engagement", int),
+)
+
+# HYPE_* settings with their own parsing instead of an _ENV_SPEC entry
+_STRUCTURED_ENV_VARS = (
+    "HYPE_FIELDS",
+    "HYPE_SUBSCRIBED_INSTANCES",
+    "HYPE_FILTERED_INSTANCES",
+    "HYPE_PREFER_MEDIA",
+    "HYPE_HASHTAG_SCORES",
+)
+_KNOWN_ENV_VARS = frozenset(spec[0] for spec in _ENV_SPEC) | frozenset(_STRUCTURED_ENV_VARS)
+
+
+def _hype_environ() -> dict:
+    """Collect HYPE_* variables in one pass over the environment."""
+    env = {key: value for key, value in os.environ.items() if key.startswith("HYPE_")}
+    for key in env.keys() - _KNOWN_ENV_VARS:
+        logging.getLogger("Config").warning("Ignoring unknown environment variable %s", key)
+    return env
+
+
+def _get_config_value(env, env_var, config_dict, config_key, default_value, value_type=str):
+    """Get configuration value from environment variable, config file, or default."""
+    # Check environment variable first
+    env_value = env.get(env_var)
+    if env_value is not None:
+        try:
+            if value_type == bool:
+                return env_value.lower() in ('true', '1', 'yes', 'on')
+            elif value_type == int:
+                return int(env_value)
+            elif value_type == float:
+                return float(env_value)
+            elif value_type == list:
+                # For lists, split by comma
+                return [item.strip() for item in env_value.split(',') if item.strip()]
+            else:
+                return env_value
+        except (ValueError, TypeError):
+            logging.getLogger("Config").warning("Invalid value for %s: %s, using default", env_var, env_value)
+
+    # Check config file value
+    if config_dict and config_dict.get(config_key) is not None:
+        return config_dict[config_key]
+
+    # Return default
+    return default_value
+
+
+# Largest page the Mastodon trending endpoint returns
+MAX_FETCH_LIMIT = 20
+
 
 class BotAccount:
     server: str
@@ -18,6 +113,8 @@ class BotAccount:
 
 
 class Instance:
+    __slots__ = ("name", "fetch_limit", "boost_limit")
+
     name: str
     fetch_limit: int
     boost_limit: int
@@ -27,11 +124,13 @@ class Instance:
         # Support legacy 'limit' parameter for backward compatibility
         if limit is not None and fetch_limit is None and boost_limit is None:
             # Legacy mode: single limit means both fetch and boost the same amount
-            self.fetch_limit = limit if limit > 0 and limit <= 20 else 20
-            self.boost_limit = limit if limit > 0 and limit <= 20 else 20
+            self.fetch_limit = min(limit, MAX_FETCH_LIMIT) if limit > 0 else MAX_FETCH_LIMIT
+            self.boost_limit = self.fetch_limit
         else:
             # New mode: separate fetch and boost limits
-            self.fetch_limit = fetch_limit if fetch_limit is not None and fetch_limit > 0 and fetch_limit <= 20 else 20
+            self.fetch_limit = (
+                min(fetch_limit, MAX_FETCH_LIMIT) if fetch_limit is not None and fetch_limit > 0 else MAX_FETCH_LIMIT
+            )
             self.boost_limit = boost_limit if boost_limit is not None and boost_limit > 0 else 4
 
     @property
@@ -45,6 +144,20 @@ class Instance:
         return f"{self.name} (fetch {self.fetch_limit}, boost {self.boost_limit})"
 
 
+# Subscriptions used when neither config.yaml nor HYPE_SUBSCRIBED_INSTANCES lists
+# any, as (name, fetch_limit, boost_limit). Instance is mutable, so each Config
+# builds its own objects from these.
+_DEFAULT_INSTANCE_SPECS = (
+    ("infosec.exchange", 20, 5),
+    ("mastodon.social", 20, 4),
+    ("mas.to", 20, 5),
+    ("fosstodon.org", 20, 6),
+    ("floss.social", 20, 4),
+    ("ioc.exchange", 20, 3),
+    ("mstdn.social", 20, 2),
+)
+
+
 class Config:
     bot_account: BotAccount
     interval: int = 15
@@ -105,217 +218,141 @@ class Config:
     local_timeline_min_engagement: int = 1  # Minimum boosts, stars, or comments required
 
     def __init__(self):
-        # Helper method to get config values with environment variable override
-        def get_config_value(env_var, config_dict, config_key, default_value, value_type=str):
-            """Get configuration value from environment variable, config file, or default."""
-            # Check environment variable first
-            env_value = os.environ.get(env_var)
-            if env_value is not None:
-                try:
-                    if value_type == bool:
-                        return env_value.lower() in ('true', '1', 'yes', 'on')
-                    elif value_type == int:
-                        return int(env_value)
-                    elif value_type == float:
-                        return float(env_value)
-                    elif value_type == list:
-                        # For lists, split by comma
-                        return [item.strip() for item in env_value.split(',') if item.strip()]
-                    else:
-                        return env_value
-                except (ValueError, TypeError):
-                    logging.getLogger("Config").warning(f"Invalid value for {env_var}: {env_value}, using default")
-            
-            # Check config file value
-            if config_dict and config_dict.get(config_key) is not None:
-                return config_dict[config_key]
-            
-            # Return default
-            return default_value
-
         # auth file containing login info
         auth = "/app/config/auth.yaml"
         # settings file containing subscriptions
         conf = "/app/config/config.yaml"
 
         # only load auth info
-        with open(auth, "r") as configfile:
-            config = yaml.load(configfile, Loader=yaml.Loader)
-            logging.getLogger("Config").debug("Loading auth info")
-            if (
-                config
-                and config.get("bot_account")
-                and config["bot_account"].get("server")
-                and config["bot_account"].get("access_token")
-            ):
-                self.bot_account = BotAccount(
-                    server=config["bot_account"]["server"],
-                    access_token=config["bot_account"]["access_token"],
-                )
-            else:
-                logging.getLogger("Config").error(config)
-                raise ConfigException("Bot account config is incomplete or missing.")
-
-        with open(conf, "r") as configfile:
-            config = yaml.load(configfile, Loader=yaml.Loader)
-            logging.getLogger("Config").debug("Loading settings")
-            if config is None:
-                config = {}  # Ensure config is not None for environment variable fallback
-                
-            # Use environment variables with fallback to config file and defaults
-            self.interval = get_config_value("HYPE_INTERVAL", config, "interval", self.interval, int)
-            self.log_level = get_config_value("HYPE_LOG_LEVEL", config, "log_level", self.log_level, str)
-            self.debug_decisions = get_config_value("HYPE_DEBUG_DECISIONS", config, "debug_decisions", self.debug_decisions, bool)
-            self.logfile_path = get_config_value("HYPE_LOGFILE_PATH", config, "logfile_path", self.logfile_path, str)
-            self.profile_prefix = get_config_value("HYPE_PROFILE_PREFIX", config, "profile_prefix", self.profile_prefix, str)
-            
-            # Handle fields configuration (complex object)
-            if os.environ.get("HYPE_FIELDS"):
-                # Simple key=value,key=value format for environment variables
-                fields_str = os.environ.get("HYPE_FIELDS")
-                self.fields = {}
-                for pair in fields_str.split(','):
-                    if '=' in pair:
-                        key, value = pair.split('=', 1)
-                        self.fields[key.strip()] = value.strip()
-            else:
-                self.fields = (
-                    {name: value for name, value in config["fields"].items()}
-                    if config.get("fields")
-                    else self.fields
-                )
-
-            # Handle subscribed instances (complex object)
-            if os.environ.get("HYPE_SUBSCRIBED_INSTANCES"):
-                # Simple name1=limit1,name2=limit2 format for environment variables  
-                instances_str = os.environ.get("HYPE_SUBSCRIBED_INSTANCES")
-                self.subscribed_instances = []
-                for pair in instances_str.split(','):
-                    if '=' in pair:
-                        name, limit = pair.split('=', 1)
-                        try:
-                            limit_int = int(limit.strip())
-                            self.subscribed_instances.append(Instance(name.strip(), limit=limit_int))
-                        except ValueError:
-                            logging.getLogger("Config").warning(f"Invalid limit for instance {name}: {limit}")
-            else:
-                self.subscribed_instances = []
-                if config.get("subscribed_instances"):
-                    for name, props in config["subscribed_instances"].items():
-                        # Support both old format (limit: int) and new format (fetch_limit/boost_limit)
-                        if isinstance(props, dict):
-                            fetch_limit = props.get("fetch_limit")
-                            boost_limit = props.get("boost_limit")
-                            limit = props.get("limit")
-                            self.subscribed_instances.append(
-                                Instance(name, limit=limit, fetch_limit=fetch_limit, boost_limit=boost_limit)
-                            )
-                        else:
-                            # Legacy format: subscribed_instances is a dict with limit as value
-                            self.subscribed_instances.append(Instance(name, limit=props))
-                else:
-                    # No instances configured - use goingdark.social defaults
-                    self.subscribed_instances = [
-                        Instance("infosec.exchange", fetch_limit=20, boost_limit=5),
-                        Instance("mastodon.social", fetch_limit=20, boost_limit=4),
-                        Instance("mas.to", fetch_limit=20, boost_limit=5),
-                        Instance("fosstodon.org", fetch_limit=20, boost_limit=6),
-                        Instance("floss.social", fetch_limit=20, boost_limit=4),
-                        Instance("ioc.exchange", fetch_limit=20, boost_limit=3),
-                        Instance("mstdn.social", fetch_limit=20, boost_limit=2)
-                    ]
-
-            self.filtered_instances = get_config_value("HYPE_FILTERED_INSTANCES", config, "filtered_instances", self.filtered_instances, list)
-            if isinstance(self.filtered_instances, list) and config.get("filtered_instances"):
-                # If from config file, it's a list of strings, keep as is
-                if not os.environ.get("HYPE_FILTERED_INSTANCES"):
-                    self.filtered_instances = [name for name in config["filtered_instances"]]
-
-            # Basic configuration parameters with environment variable support
-            self.daily_public_cap = get_config_value("HYPE_DAILY_PUBLIC_CAP", config, "daily_public_cap", self.daily_public_cap, int)
-            self.per_hour_public_cap = get_config_value("HYPE_PER_HOUR_PUBLIC_CAP", config, "per_hour_public_cap", self.per_hour_public_cap, int)
-            self.max_boosts_per_run = get_config_value("HYPE_MAX_BOOSTS_PER_RUN", config, "max_boosts_per_run", self.max_boosts_per_run, int)
-            self.max_boosts_per_author_per_day = get_config_value("HYPE_MAX_BOOSTS_PER_AUTHOR_PER_DAY", config, "max_boosts_per_author_per_day", self.max_boosts_per_author_per_day, int)
-            self.author_diversity_enforced = get_config_value("HYPE_AUTHOR_DIVERSITY_ENFORCED", config, "author_diversity_enforced", self.author_diversity_enforced, bool)
+        config = _load_yaml(auth)
+        logging.getLogger("Config").debug("Loading auth info")
+        if (
+            config
+            and config.get("bot_account")
+            and config["bot_account"].get("server")
+            and config["bot_account"].get("access_token")
+        ):
+            self.bot_account = BotAccount(
+                server=config["bot_account"]["server"],
+                access_token=config["bot_account"]["access_token"],
+            )
+        else:
+            logging.getLogger("Config").error(config)
+            raise ConfigException("Bot account config is incomplete or missing.")
+
+        config = _load_yaml(conf)
+        logging.getLogger("Config").debug("Loading settings")
+        if config is None:
+            config = {}  # Ensure config is not None for environment variable fallback
             
-            # Handle prefer_media with special bool/float logic
-            prefer_media_env = os.environ.get("HYPE_PREFER_MEDIA")
-            if prefer_media_env is not None:
-                if prefer_media_env.lower() in ('true', '1', 'yes', 'on'):
-                    self.prefer_media = 1
-                elif prefer_media_env.lower() in ('false', '0', 'no', 'off'):
-                    self.prefer_media = 0
-                else:
+        # Use environment variables with fallback to config file and defaults
+        env = _hype_environ()
+        for env_var, key, value_type in _ENV_SPEC:
+            setattr(self, key, _get_config_value(env, env_var, config, key, getattr(self, key), value_type))
+
+        # Handle fields configuration (complex object)
+        if env.get("HYPE_FIELDS"):
+            # Simple key=value,key=value format for environment variables
+            fields_str = env.get("HYPE_FIELDS")
+            self.fields = {}
+            for pair in fields_str.split(','):
+                if '=' in pair:
+                    key, value = pair.split('=', 1)
+                    self.fields[key.strip()] = value.strip()
+        else:
+            self.fields = (
+                {name: value for name, value in config["fields"].items()}
+                if config.get("fields")
+                else self.fields
+            )
+
+        # Handle subscribed instances (complex object)
+        if env.get("HYPE_SUBSCRIBED_INSTANCES"):
+            # Simple name1=limit1,name2=limit2 format for environment variables  
+            instances_str = env.get("HYPE_SUBSCRIBED_INSTANCES")
+            self.subscribed_instances = []
+            for pair in instances_str.split(','):
+                if '=' in pair:
+                    name, limit = pair.split('=', 1)
                     try:
-                        self.prefer_media = float(prefer_media_env)
+                        limit_int = int(limit.strip())
+                        self.subscribed_instances.append(Instance(name.strip(), limit=limit_int))
                     except ValueError:
-                        self.prefer_media = self.prefer_media
+                        logging.getLogger("Config").warning("Invalid limit for instance %s: %s", name, limit)
+        else:
+            self.subscribed_instances = []
+            if config.get("subscribed_instances"):
+                for name, props in config["subscribed_instances"].items():
+                    # Support both old format (limit: int) and new format (fetch_limit/boost_limit)
+                    if isinstance(props, dict):
+                        fetch_limit = props.get("fetch_limit")
+                        boost_limit = props.get("boost_limit")
+                        limit = props.get("limit")
+                        self.subscribed_instances.append(
+                            Instance(name, limit=limit, fetch_limit=fetch_limit, boost_limit=boost_limit)
+                        )
+                    else:
+                        # Legacy format: subscribed_instances is a dict with limit as value
+                        self.subscribed_instances.append(Instance(name, limit=props))
             else:
-                pm = config.get("prefer_media", self.prefer_media)
-                if isinstance(pm, bool):
-                    self.prefer_media = 1 if pm else 0
-                else:
-                    try:
-                        self.prefer_media = float(pm)
-                    except (TypeError, ValueError):
-                        self.prefer_media = self.prefer_media
-                        
-            self.require_media = get_config_value("HYPE_REQUIRE_MEDIA", config, "require_media", self.require_media, bool)
-            self.skip_sensitive_without_cw = get_config_value("HYPE_SKIP_SENSITIVE_WITHOUT_CW", config, "skip_sensitive_without_cw", self.skip_sensitive_without_cw, bool)
-            self.min_reblogs = get_config_value("HYPE_MIN_REBLOGS", config, "min_reblogs", self.min_reblogs, int)
-            self.min_favourites = get_config_value("HYPE_MIN_FAVOURITES", config, "min_favourites", self.min_favourites, int)
-            self.min_replies = get_config_value("HYPE_MIN_REPLIES", config, "min_replies", self.min_replies, int)
-            self.languages_allowlist = get_config_value("HYPE_LANGUAGES_ALLOWLIST", config, "languages_allowlist", self.languages_allowlist, list)
-            self.use_mastodon_language_detection = get_config_value("HYPE_USE_MASTODON_LANGUAGE_DETECTION", config, "use_mastodon_language_detection", self.use_mastodon_language_detection, bool)
-            self.state_path = get_config_value("HYPE_STATE_PATH", config, "state_path", self.state_path, str)
-            self.seen_cache_size = get_config_value("HYPE_SEEN_CACHE_SIZE", config, "seen_cache_size", self.seen_cache_size, int)
-            
-            # Handle hashtag_scores (complex object) 
-            hashtag_scores_env = os.environ.get("HYPE_HASHTAG_SCORES")
-            if hashtag_scores_env:
-                # Simple tag1=score1,tag2=score2 format for environment variables
-                self.hashtag_scores = {}
-                for pair in hashtag_scores_env.split(','):
-                    if '=' in pair:
-                        tag, score = pair.split('=', 1)
-                        try:
-                            self.hashtag_scores[tag.strip().lower()] = float(score.strip())
-                        except ValueError:
-                            logging.getLogger("Config").warning(f"Invalid score for hashtag {tag}: {score}")
+                # No instances configured - use goingdark.social defaults
+                self.subscribed_instances = [
+                    Instance(name, fetch_limit=fetch_limit, boost_limit=boost_limit)
+                    for name, fetch_limit, boost_limit in _DEFAULT_INSTANCE_SPECS
+                ]
+
+        self.filtered_instances = _get_config_value(env, "HYPE_FILTERED_INSTANCES", config, "filtered_instances", self.filtered_instances, list)
+        if isinstance(self.filtered_instances, list) and config.get("filtered_instances"):
+            # If from config file, it's a list of strings, keep as is
+            if not env.get("HYPE_FILTERED_INSTANCES"):
+                self.filtered_instances = [name for name in config["filtered_instances"]]
+
+        # Handle prefer_media with special bool/float logic
+        prefer_media_env = env.get("HYPE_PREFER_MEDIA")
+        if prefer_media_env is not None:
+            if prefer_media_env.lower() in ('true', '1', 'yes', 'on'):
+                self.prefer_media = 1
+            elif prefer_media_env.lower() in ('false', '0', 'no', 'off'):
+                self.prefer_media = 0
             else:
-                config_hashtag_scores = config.get("hashtag_scores")
-                if config_hashtag_scores:
-                    self.hashtag_scores = {
-                        k.lower(): float(v)  # Changed to float to support negative values
-                        for k, v in config_hashtag_scores.items()
-                    }
-                # If config doesn't specify hashtag_scores, keep the default from class attribute
-                
-            # Age decay configuration
-            self.age_decay_enabled = get_config_value("HYPE_AGE_DECAY_ENABLED", config, "age_decay_enabled", self.age_decay_enabled, bool)
-            self.age_decay_half_life_hours = get_config_value("HYPE_AGE_DECAY_HALF_LIFE_HOURS", config, "age_decay_half_life_hours", self.age_decay_half_life_hours, float)
-            
-            # Hashtag diversity configuration
-            self.hashtag_diversity_enforced = get_config_value("HYPE_HASHTAG_DIVERSITY_ENFORCED", config, "hashtag_diversity_enforced", self.hashtag_diversity_enforced, bool)
-            self.max_boosts_per_hashtag_per_run = get_config_value("HYPE_MAX_BOOSTS_PER_HASHTAG_PER_RUN", config, "max_boosts_per_hashtag_per_run", self.max_boosts_per_hashtag_per_run, int)
-            
-            # Spam detection configuration
-            self.spam_emoji_penalty = get_config_value("HYPE_SPAM_EMOJI_PENALTY", config, "spam_emoji_penalty", self.spam_emoji_penalty, float)
-            self.spam_emoji_threshold = get_config_value("HYPE_SPAM_EMOJI_THRESHOLD", config, "spam_emoji_threshold", self.spam_emoji_threshold, int)
-            self.spam_link_penalty = get_config_value("HYPE_SPAM_LINK_PENALTY", config, "spam_link_penalty", self.spam_link_penalty, float)
-            
-            # Quality threshold configuration
-            self.min_score_threshold = get_config_value("HYPE_MIN_SCORE_THRESHOLD", config, "min_score_threshold", self.min_score_threshold, float)
-            
-            # Related hashtag scoring configuration (complex object - only from config file for now)
-            self.related_hashtags = config.get("related_hashtags", self.related_hashtags) or {}
+                try:
+                    self.prefer_media = float(prefer_media_env)
+                except ValueError:
+                    self.prefer_media = self.prefer_media
+        else:
+            pm = config.get("prefer_media", self.prefer_media)
+            if isinstance(pm, bool):
+                self.prefer_media = 1 if pm else 0
+            else:
+                try:
+                    self.prefer_media = float(pm)
+                except (TypeError, ValueError):
+                    self.prefer_media = self.prefer_media
+                    
+        
+        # Handle hashtag_scores (complex object) 
+        hashtag_scores_env = env.get("HYPE_HASHTAG_SCORES")
+        if hashtag_scores_env:
+            # Simple tag1=score1,tag2=score2 format for environment variables
+            self.hashtag_scores = {}
+            for pair in hashtag_scores_env.split(','):
+                if '=' in pair:
+                    tag, score = pair.split('=', 1)
+                    try:
+                        self.hashtag_scores[tag.strip().lower()] = float(score.strip())
+                    except ValueError:
+                        logging.getLogger("Config").warning("Invalid score for hashtag %s: %s", tag, score)
+        else:
+            config_hashtag_scores = config.get("hashtag_scores")
+            if config_hashtag_scores:
+                self.hashtag_scores = {
+                    k.lower(): float(v)  # Changed to float to support negative values
+                    for k, v in config_hashtag_scores.items()
+                }
+            # If config doesn't specify hashtag_scores, keep the default from class attribute
             
-            # Local timeline configuration
-            self.local_timeline_enabled = get_config_value("HYPE_LOCAL_TIMELINE_ENABLED", config, "local_timeline_enabled", self.local_timeline_enabled, bool)
-            self.local_timeline_fetch_limit = get_config_value("HYPE_LOCAL_TIMELINE_FETCH_LIMIT", config, "local_timeline_fetch_limit", self.local_timeline_fetch_limit, int)
-            self.local_timeline_boost_limit = get_config_value("HYPE_LOCAL_TIMELINE_BOOST_LIMIT", config, "local_timeline_boost_limit", self.local_timeline_boost_limit, int)
-            self.local_timeline_min_engagement = get_config_value("HYPE_LOCAL_TIMELINE_MIN_ENGAGEMENT", config, "local_timeline_min_engagement", self.local_timeline_min_engagement, int)
-
+        # Related hashtag scoring configuration (complex object - only from config file for now)
+        self.related_hashtags = config.get("related_hashtags", self.related_hashtags) or {}
 
 
 class ConfigException(Exception):
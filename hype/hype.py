@@ -1,22 +1,88 @@
+import hashlib
 import json
 import logging
 import os.path
 import re
+import signal
+import sys
 import time
-from collections import deque
-from datetime import datetime, timezone
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 import math
+import heapq
 import html
 
 import schedule
 from mastodon import Mastodon
-from mastodon.errors import MastodonAPIError, MastodonNotFoundError
+from mastodon.errors import MastodonAPIError, MastodonInternalServerError, MastodonNotFoundError
 from langdetect import detect, LangDetectException
 
 from .config import Config
 
+# A tag body can't contain '<', which keeps the scan linear on unclosed brackets
+_HTML_TAG_RE = re.compile(r'<[^<>]+>')
+_URL_RE = re.compile(r'https?://\S+')
+_MENTION_OR_HASHTAG_RE = re.compile(r'[@#]\S+')
+_WHITESPACE_RE = re.compile(r'\s+')
+# Spam heuristics; the emoji class matches one emoji at a time so they can be counted
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map symbols
+    "\U0001F1E0-\U0001F1FF"  # flags (iOS)
+    "\U00002702-\U000027B0"  # dingbats
+    "\U000024C2-\U0001F251"
+    "]"
+)
+_LINK_RE = re.compile(r'https?://[^\s<>"]+|www\.[^\s<>"]+')
+# Shortest cleaned text worth handing to langdetect
+_MIN_DETECT_CHARS = 10
+
+
+def _clean_and_detect(content: str) -> str:
+    if not content.strip():
+        return ""
+    
+    # Remove HTML tags (as spaces, so <p>one</p><p>two</p> stays two words)
+    # and decode HTML entities
+    if '<' in content:
+        content = _HTML_TAG_RE.sub(' ', content)
+    clean_content = html.unescape(content)
+    
+    # Remove URLs to avoid language detection from links
+    clean_content = _URL_RE.sub(' ', clean_content)
+    
+    # Remove mentions and hashtags as they can interfere with detection
+    clean_content = _MENTION_OR_HASHTAG_RE.sub(' ', clean_content)
+    
+    # Collapse the leftover whitespace
+    clean_content = _WHITESPACE_RE.sub(' ', clean_content).strip()
+    
+    # Need at least some text to detect language reliably
+    if len(clean_content) < _MIN_DETECT_CHARS:
+        return ""
+    
+    try:
+        return detect(clean_content).lower()
+    except LangDetectException:
+        # Language detection failed (e.g., no text features, too short, etc.)
+        return ""
+
 
 class Hype:
+    # Boost events appended to the state log before it is folded into the state file
+    STATE_LOG_CHECKPOINT = 50
+    # Upper bound on concurrent trending fetches from subscribed instances
+    MAX_FETCH_WORKERS = 8
+    # Seconds a cached remote-instance client is reused before it is rebuilt
+    CLIENT_TTL_SECONDS = 6 * 3600
+    # Pause before the single retry of a federation search that hit a 500
+    SEARCH_RETRY_DELAY_SECONDS = 0.5
+    # Post bodies whose detected language is remembered between cycles
+    LANGUAGE_CACHE_SIZE = 4096
+
     def __init__(self, config: Config) -> None:
         self.config = config
         
@@ -74,13 +140,38 @@ class Hype:
             self.state.get("seen_status_ids", []),
             maxlen=self.config.seen_cache_size,
         )
+        # Hash index over _seen so membership checks don't scan the deque
+        self._seen_index = Counter(self._seen)
         self._boosted_today = self.state.get("authors_boosted_today", {})
+        self._filtered_instances = frozenset(self.config.filtered_instances)
+        # Scoring tables with keys normalized once ("#HomeLab" -> "homelab"),
+        # matching _tags_lc()
+        self._hashtag_scores = {
+            self._normalize_tag(tag): float(score)
+            for tag, score in self.config.hashtag_scores.items()
+        }
+        self._hashtag_score_keys = frozenset(self._hashtag_scores)
+        # Related terms only earn a bonus for main hashtags with a positive weight
+        self._related_hashtags = [
+            (self._normalize_tag(main), [(term.lower(), float(multiplier)) for term, multiplier in terms.items()])
+            for main, terms in (self.config.related_hashtags or {}).items()
+            if self._hashtag_scores.get(self._normalize_tag(main), 0) > 0
+        ]
+        self._related_terms_re, self._related_term_closure = self._build_related_matcher()
+        # Content filter with config values bound once
+        self._skip = self._make_skip_predicate()
+        self._score = self._make_scorer()
+        self._content_score_ceiling = self._max_content_score()
         # Track hashtags boosted in current run for diversity enforcement
-        self._hashtags_boosted_this_run = []
+        self._hashtags_boosted_this_run = Counter()
+        # Remote instance clients, reused across boost cycles
+        self._clients = {}
+        # Detected language by 64-bit content digest, oldest first
+        self._lang_cache = OrderedDict()
         self.log.info("Config loaded")
 
     def login(self):
-        self.log.info(f"Logging in to {self.config.bot_account.server}")
+        self.log.info("Logging in to %s", self.config.bot_account.server)
         self.client = Mastodon(
             api_base_url=self.config.bot_account.server,
             access_token=self.config.bot_account.access_token,
@@ -101,24 +192,112 @@ class Hype:
         self._save_state()
 
     def _load_state(self):
+        data = None
         try:
             if os.path.isfile(self.config.state_path):
                 with open(self.config.state_path, "r") as handle:
                     data = json.load(handle)
                     data.setdefault("seen_status_ids", [])
                     data.setdefault("author_boost_timestamps", {})
-                    return data
-        except Exception:
-            pass
-        return {
-            "seen_status_ids": [],
-            "authors_boosted_today": {},
-            "author_boost_timestamps": {},
-            "day": "",
-            "day_count": 0,
-            "hour": "",
-            "hour_count": 0,
+        except Exception as err:
+            self.log.error("could not load state, starting fresh: %s", err)
+            data = None
+        if data is None:
+            data = {
+                "seen_status_ids": [],
+                "authors_boosted_today": {},
+                "author_boost_timestamps": {},
+                "day": "",
+                "day_count": 0,
+                "hour": "",
+                "hour_count": 0,
+            }
+        self._replay_state_log(data)
+        return data
+
+    def _state_log_path(self) -> str:
+        return f"{self.config.state_path}.log"
+
+    def _replay_state_log(self, data: dict):
+        """
+        Apply boost events appended since the last full state checkpoint.
+        Events numbered at or below the checkpoint's log_seq are already in
+        the state file (the log outlived its checkpoint) and are skipped.
+        """
+        self._state_log_events = 0
+        checkpoint_seq = data.get("log_seq", 0)
+        self._state_log_seq = checkpoint_seq
+        if not self.config.state_path:
+            return
+        path = self._state_log_path()
+        if not os.path.isfile(path):
+            return
+        try:
+            with open(path, "r") as handle:
+                for line in handle:
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        # A torn final line from an interrupted write
+                        continue
+                    seq = event.get("seq")
+                    if seq is not None:
+                        if seq <= checkpoint_seq:
+                            continue
+                        self._state_log_seq = max(self._state_log_seq, seq)
+                    self._apply_boost_event(data, event)
+                    self._state_log_events += 1
+        except Exception as err:
+            self.log.error("could not replay state log: %s", err)
+
+    def _apply_boost_event(self, data: dict, event: dict):
+        data.setdefault("seen_status_ids", []).extend(event.get("seen", []))
+        author = event.get("author", "unknown")
+        if event.get("ts"):
+            data.setdefault("author_boost_timestamps", {})[author] = event["ts"]
+        if data.get("day") != event.get("day"):
+            data["day"] = event.get("day")
+            data["day_count"] = 0
+            data["authors_boosted_today"] = {}
+        data["day_count"] = data.get("day_count", 0) + 1
+        authors = data.setdefault("authors_boosted_today", {})
+        authors[author] = authors.get(author, 0) + 1
+        if data.get("hour") != event.get("hour"):
+            data["hour"] = event.get("hour")
+            data["hour_count"] = 0
+        data["hour_count"] = data.get("hour_count", 0) + 1
+
+    def _log_boost(self, status: dict):
+        """
+        Append a single boost event to the state log instead of rewriting the
+        whole state file. The log is folded into the state file every
+        STATE_LOG_CHECKPOINT events, so a boost cycle normally never rewrites
+        the full state.
+        """
+        if not self.config.state_path:
+            return
+        sid = status.get("id", "unknown")
+        url = status.get("url") or status.get("uri")
+        author = status.get("account", {}).get("acct", "unknown")
+        self._state_log_seq += 1
+        event = {
+            "seq": self._state_log_seq,
+            "seen": [sid, url] if url else [sid],
+            "author": author,
+            "ts": self.state.get("author_boost_timestamps", {}).get(author),
+            "day": self.state.get("day"),
+            "hour": self.state.get("hour"),
         }
+        try:
+            with open(self._state_log_path(), "a") as handle:
+                handle.write(json.dumps(event, separators=(",", ":")) + "\n")
+            self._state_log_events += 1
+        except Exception as err:
+            self.log.error("could not append to state log: %s", err)
+            self._save_state()
+            return
+        if self._state_log_events >= self.STATE_LOG_CHECKPOINT:
+            self._save_state()
 
     def _save_state(self):
         self.state["seen_status_ids"] = list(self._seen)
@@ -131,16 +310,40 @@ class Hype:
             for author, timestamp in self.state.get("author_boost_timestamps", {}).items()
             if timestamp > cutoff
         }
+        # Log events up to this number are folded into the checkpoint
+        self.state["log_seq"] = self._state_log_seq
+        # An empty state_path keeps state in memory only
+        if not self.config.state_path:
+            return
+        # Write a sibling file and swap it in, so a crash mid-write leaves the
+        # previous checkpoint intact instead of a truncated state.json
+        tmp_path = f"{self.config.state_path}.tmp"
         try:
-            with open(self.config.state_path, "w") as handle:
-                json.dump(self.state, handle)
+            with open(tmp_path, "w") as handle:
+                # Serialize up front so the file gets a single compact write
+                handle.write(json.dumps(self.state, separators=(",", ":")))
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(tmp_path, self.config.state_path)
         except Exception as err:
-            self.log.error(f"could not persist state: {err}")
+            self.log.error("could not persist state: %s", err)
+            return
+        # The checkpoint now holds everything the log recorded; if we die
+        # before the log is gone, replay skips it by log_seq
+        if self._state_log_events:
+            try:
+                os.remove(self._state_log_path())
+            except FileNotFoundError:
+                pass
+            except Exception as err:
+                self.log.error("could not truncate state log: %s", err)
+            self._state_log_events = 0
 
     def _tick_counters(self):
-        now = datetime.now(timezone.utc)
-        day_key = now.strftime("%Y-%m-%d")
-        hour_key = now.strftime("%Y-%m-%dT%H")
+        # "YYYY-MM-DDTHH+00:00"; its prefixes are the day and hour keys
+        stamp = datetime.now(timezone.utc).isoformat(timespec="hours")
+        day_key = stamp[:10]
+        hour_key = stamp[:13]
         if self.state.get("day") != day_key:
             self.state["day"] = day_key
             self.state["day_count"] = 0
@@ -162,6 +365,14 @@ class Hype:
         self.state["day_count"] += 1
         self.state["hour_count"] += 1
 
+    def _engagement_counts(self, status: dict) -> tuple:
+        """(reblogs, favourites, replies) of a status, for comparing copies of one post."""
+        return (
+            self._safe_count(status.get("reblogs_count", 0)),
+            self._safe_count(status.get("favourites_count", 0)),
+            self._safe_count(status.get("replies_count", 0)),
+        )
+
     def _safe_count(self, value) -> int:
         try:
             number = int(value)
@@ -169,29 +380,45 @@ class Hype:
             return 0
         return number if number > 0 else 0
 
+    @staticmethod
+    def _normalize_tag(name: str) -> str:
+        return name.lower().lstrip("#")
+
+    def _tags_lc(self, status: dict) -> frozenset:
+        """Lowercased hashtag names of a status, computed once and kept on the status."""
+        tags = status.get("_tag_lc")
+        if tags is None:
+            tags = frozenset(tag.get("name", "").lower() for tag in status.get("tags") or ())
+            status["_tag_lc"] = tags
+        return tags
+
     def _hashtag_diversity_hit(self, status: dict) -> bool:
         """Check if hashtag diversity limit is hit for any hashtag in the status."""
         if not self.config.hashtag_diversity_enforced:
             return False
             
-        hashtags = status.get("tags", [])
-        for tag in hashtags:
-            tag_name = tag.get("name", "").lower()
-            # Count how many times this hashtag has been boosted this run
-            hashtag_count = self._hashtags_boosted_this_run.count(tag_name)
-            if hashtag_count >= self.config.max_boosts_per_hashtag_per_run:
-                return True
-        return False
+        boosted = self._hashtags_boosted_this_run
+        limit = self.config.max_boosts_per_hashtag_per_run
+        return any(boosted[tag_name] >= limit for tag_name in self._tags_lc(status))
+
+    def _in_seen_cache(self, status: dict) -> bool:
+        """Cheap pre-scoring check: status id or URL already in the seen cache."""
+        if status.get("id", "unknown") in self._seen_index:
+            return True
+        url = status.get("url") or status.get("uri")
+        return bool(url) and url in self._seen_index
 
     def _seen_status(self, status: dict) -> bool:
         sid = status.get("id", "unknown")
         url = status.get("url") or status.get("uri")
         author = status.get("account", {}).get("acct", "unknown")
         
-        # Check various conditions for seen status
-        sid_seen = sid in self._seen
-        url_seen = url in self._seen if url else False
+        # Check various conditions for seen status, cheapest first
+        sid_seen = sid in self._seen_index
+        url_seen = url in self._seen_index if url else False
         already_reblogged = status.get("reblogged", False)
+        if (sid_seen or url_seen or already_reblogged) and not self.config.debug_decisions:
+            return True
         
         # Check if author was boosted within the last 24 hours
         author_limit_hit = False
@@ -210,36 +437,48 @@ class Hype:
         # Debug logging for seen status decision
         if self.config.debug_decisions:
             sid_display = sid[:8] + "..." if len(str(sid)) > 8 else str(sid)
-            self.debug_log.debug(f"STATUS {sid_display} | SEEN CHECK: {is_seen}")
-            self.debug_log.debug(f"  Author: {author}")
-            self.debug_log.debug(f"  ID seen: {sid_seen}")
-            self.debug_log.debug(f"  URL seen: {url_seen}")
-            self.debug_log.debug(f"  Already reblogged: {already_reblogged}")
+            self.debug_log.debug("STATUS %s | SEEN CHECK: %s", sid_display, is_seen)
+            self.debug_log.debug("  Author: %s", author)
+            self.debug_log.debug("  ID seen: %s", sid_seen)
+            self.debug_log.debug("  URL seen: %s", url_seen)
+            self.debug_log.debug("  Already reblogged: %s", already_reblogged)
             if self.config.author_diversity_enforced:
                 author_boost_timestamps = self.state.get("author_boost_timestamps", {})
                 if author in author_boost_timestamps:
                     last_boost_time = author_boost_timestamps[author]
                     now = datetime.now(timezone.utc).timestamp()
                     hours_since_boost = (now - last_boost_time) / 3600
-                    self.debug_log.debug(f"  Hours since last boost: {hours_since_boost:.2f}")
+                    self.debug_log.debug("  Hours since last boost: %.2f", hours_since_boost)
                 else:
-                    self.debug_log.debug(f"  Author never boosted before")
-                self.debug_log.debug(f"  Author limit hit: {author_limit_hit}")
+                    self.debug_log.debug("  Author never boosted before")
+                self.debug_log.debug("  Author limit hit: %s", author_limit_hit)
             if self.config.hashtag_diversity_enforced:
-                hashtags = [tag.get("name", "").lower() for tag in status.get("tags", [])]
-                self.debug_log.debug(f"  Hashtags: {hashtags}")
-                self.debug_log.debug(f"  Hashtags boosted this run: {self._hashtags_boosted_this_run}")
-                self.debug_log.debug(f"  Hashtag limit hit: {hashtag_limit_hit}")
+                self.debug_log.debug("  Hashtags: %s", sorted(self._tags_lc(status)))
+                self.debug_log.debug("  Hashtags boosted this run: %s", dict(self._hashtags_boosted_this_run))
+                self.debug_log.debug("  Hashtag limit hit: %s", hashtag_limit_hit)
         
         return is_seen
 
+    def _mark_seen(self, key):
+        """Append to the bounded seen cache, keeping _seen_index in step with evictions."""
+        seen = self._seen
+        if seen.maxlen is not None and len(seen) == seen.maxlen:
+            if not seen.maxlen:
+                return
+            evicted = seen.popleft()
+            self._seen_index[evicted] -= 1
+            if self._seen_index[evicted] <= 0:
+                del self._seen_index[evicted]
+        seen.append(key)
+        self._seen_index[key] += 1
+
     def _remember_status(self, status: dict):
         sid = status.get("id", "unknown")
         url = status.get("url") or status.get("uri")
         author = status.get("account", {}).get("acct", "unknown")
-        self._seen.append(sid)
+        self._mark_seen(sid)
         if url:
-            self._seen.append(url)
+            self._mark_seen(url)
         
         # Track author for per-day statistics (kept for backward compatibility)
         self._boosted_today[author] = self._boosted_today.get(author, 0) + 1
@@ -253,269 +492,361 @@ class Hype:
         
         # Track hashtags for diversity enforcement in current run
         if self.config.hashtag_diversity_enforced:
-            hashtags = status.get("tags", [])
-            for tag in hashtags:
-                tag_name = tag.get("name", "").lower()
-                self._hashtags_boosted_this_run.append(tag_name)
+            self._hashtags_boosted_this_run.update(self._tags_lc(status))
 
     def _detect_language_from_content(self, status: dict) -> str:
         """
         Detect language from post content using langdetect library.
         Returns the detected language code (e.g., 'en', 'nl', 'fr') or empty string if detection fails.
+        Cached because trending posts are re-fetched every cycle until they are
+        boosted or drop off the list; keyed on a digest so the cache doesn't
+        hold on to every post's HTML.
         """
+        content = status.get("content", "") or ""
+        key = hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=8).digest()
+        lang = self._lang_cache.get(key)
+        if lang is not None:
+            self._lang_cache.move_to_end(key)
+            return lang
         try:
-            # Get content and clean it
-            content = status.get("content", "") or ""
-            if not content.strip():
-                return ""
+            lang = _clean_and_detect(content)
+        except Exception as e:
+            # Unexpected error, log it
+            if self.config.debug_decisions:
+                self.debug_log.warning("Language detection error: %s", e)
+            return ""
+        self._lang_cache[key] = lang
+        if len(self._lang_cache) > self.LANGUAGE_CACHE_SIZE:
+            self._lang_cache.popitem(last=False)
+        return lang
+
+    def _make_skip_predicate(self):
+        """
+        Build the content filter behind _should_skip_status with the relevant
+        config values bound as locals, so the per-status check does no config
+        attribute lookups. Outside debug mode the filter short-circuits.
+        """
+        require_media = self.config.require_media
+        skip_sensitive_without_cw = self.config.skip_sensitive_without_cw
+        languages_allowlist = self.config.languages_allowlist
+        use_mastodon_language_detection = self.config.use_mastodon_language_detection
+        min_reblogs = self.config.min_reblogs
+        min_favourites = self.config.min_favourites
+        min_replies = self.config.min_replies
+        debug_decisions = self.config.debug_decisions
+        debug_log = self.debug_log
+        detect_language = self._detect_language_from_content
+        safe_count = self._safe_count
+
+        def should_skip(status: dict) -> bool:
+            sid = status.get("id", "unknown")
             
-            # Remove HTML tags and decode HTML entities
-            clean_content = html.unescape(re.sub(r'<[^>]+>', '', content))
+            # Check media requirement
+            has_media = bool(status.get("media_attachments"))
+            skip_no_media = require_media and not has_media
             
-            # Remove URLs to avoid language detection from links
-            clean_content = re.sub(r'https?://\S+', '', clean_content)
+            # Check sensitive content without content warning
+            is_sensitive = status.get("sensitive", False)
+            spoiler_text = (status.get("spoiler_text") or "").strip()
+            skip_sensitive = (
+                skip_sensitive_without_cw
+                and is_sensitive
+                and not spoiler_text
+            )
             
-            # Remove mentions and hashtags as they can interfere with detection
-            clean_content = re.sub(r'@\S+', '', clean_content)
-            clean_content = re.sub(r'#\S+', '', clean_content)
+            # Check language allowlist
+            lang = ""
+            if languages_allowlist:
+                if use_mastodon_language_detection:
+                    # Use Mastodon's language detection (can be incorrect)
+                    lang = (status.get("language") or "").lower()
+                    if debug_decisions:
+                        sid_display = sid[:8] + "..." if len(str(sid)) > 8 else str(sid)
+                        debug_log.debug("STATUS %s | Using Mastodon's language: '%s'", sid_display, lang)
+                else:
+                    # Always detect language from content (default, more reliable)
+                    lang = detect_language(status)
+                    if debug_decisions:
+                        sid_display = sid[:8] + "..." if len(str(sid)) > 8 else str(sid)
+                        mastodon_lang = (status.get("language") or "").lower()
+                        if lang:
+                            debug_log.debug("STATUS %s | Language detected from content: '%s' (Mastodon reported: '%s')", sid_display, lang, mastodon_lang)
+                        else:
+                            debug_log.debug("STATUS %s | Language detection failed (Mastodon reported: '%s')", sid_display, mastodon_lang)
             
-            # Strip whitespace
-            clean_content = clean_content.strip()
+            skip_language = (
+                languages_allowlist
+                and lang not in languages_allowlist
+            )
             
-            # Need at least some text to detect language reliably
-            if len(clean_content) < 10:
-                return ""
+            # Check minimum engagement
+            reblogs_count = safe_count(status.get("reblogs_count", 0))
+            favourites_count = safe_count(status.get("favourites_count", 0))
+            replies_count = safe_count(status.get("replies_count", 0))
+            skip_low_reblogs = reblogs_count < min_reblogs
+            skip_low_favourites = favourites_count < min_favourites
+            skip_low_replies = replies_count < min_replies
             
-            # Detect language
-            detected_lang = detect(clean_content)
-            return detected_lang.lower()
-        except LangDetectException:
-            # Language detection failed (e.g., no text features, too short, etc.)
-            return ""
-        except Exception as e:
-            # Unexpected error, log it
-            if self.config.debug_decisions:
-                self.debug_log.warning(f"Language detection error: {e}")
-            return ""
+            should_skip = (
+                skip_no_media
+                or skip_sensitive
+                or skip_language
+                or skip_low_reblogs
+                or skip_low_favourites
+                or skip_low_replies
+            )
+            
+            # Debug logging for filtering decision
+            if debug_decisions:
+                sid_display = sid[:8] + "..." if len(str(sid)) > 8 else str(sid)
+                debug_log.debug("STATUS %s | FILTER CHECK: %s", sid_display, 'SKIP' if should_skip else 'KEEP')
+                debug_log.debug("  Media attachments: %s", len(status.get('media_attachments', [])))
+                debug_log.debug("  Skip no media: %s (require_media: %s)", skip_no_media, require_media)
+                debug_log.debug("  Sensitive: %s, CW: '%s'", is_sensitive, spoiler_text)
+                debug_log.debug("  Skip sensitive: %s", skip_sensitive)
+                debug_log.debug("  Language: '%s', allowlist: %s", lang, languages_allowlist)
+                debug_log.debug("  Skip language: %s", skip_language)
+                debug_log.debug("  Reblogs: %s (min: %s)", reblogs_count, min_reblogs)
+                debug_log.debug("  Skip low reblogs: %s", skip_low_reblogs)
+                debug_log.debug("  Favourites: %s (min: %s)", favourites_count, min_favourites)
+                debug_log.debug("  Skip low favourites: %s", skip_low_favourites)
+                debug_log.debug("  Replies: %s (min: %s)", replies_count, min_replies)
+                debug_log.debug("  Skip low replies: %s", skip_low_replies)
+            
+            return should_skip
 
-    def _should_skip_status(self, status: dict) -> bool:
-        sid = status.get("id", "unknown")
-        
-        # Check media requirement
-        has_media = bool(status.get("media_attachments"))
-        skip_no_media = self.config.require_media and not has_media
-        
-        # Check sensitive content without content warning
-        is_sensitive = status.get("sensitive", False)
-        spoiler_text = (status.get("spoiler_text") or "").strip()
-        skip_sensitive = (
-            self.config.skip_sensitive_without_cw
-            and is_sensitive
-            and not spoiler_text
-        )
-        
-        # Check language allowlist
-        lang = ""
-        if self.config.languages_allowlist:
-            if self.config.use_mastodon_language_detection:
-                # Use Mastodon's language detection (can be incorrect)
+        def first_failing_check(status: dict) -> bool:
+            # Same verdict as should_skip, but stops at the first failing check
+            # and leaves language detection, the costly one, for last
+            if require_media and not status.get("media_attachments"):
+                return True
+            if (
+                skip_sensitive_without_cw
+                and status.get("sensitive", False)
+                and not (status.get("spoiler_text") or "").strip()
+            ):
+                return True
+            if (
+                safe_count(status.get("reblogs_count", 0)) < min_reblogs
+                or safe_count(status.get("favourites_count", 0)) < min_favourites
+                or safe_count(status.get("replies_count", 0)) < min_replies
+            ):
+                return True
+            if not languages_allowlist:
+                return False
+            if use_mastodon_language_detection:
                 lang = (status.get("language") or "").lower()
-                if self.config.debug_decisions:
-                    sid_display = sid[:8] + "..." if len(str(sid)) > 8 else str(sid)
-                    self.debug_log.debug(f"STATUS {sid_display} | Using Mastodon's language: '{lang}'")
             else:
-                # Always detect language from content (default, more reliable)
-                lang = self._detect_language_from_content(status)
-                if self.config.debug_decisions:
-                    sid_display = sid[:8] + "..." if len(str(sid)) > 8 else str(sid)
-                    mastodon_lang = (status.get("language") or "").lower()
-                    if lang:
-                        self.debug_log.debug(f"STATUS {sid_display} | Language detected from content: '{lang}' (Mastodon reported: '{mastodon_lang}')")
-                    else:
-                        self.debug_log.debug(f"STATUS {sid_display} | Language detection failed (Mastodon reported: '{mastodon_lang}')")
-        
-        skip_language = (
-            self.config.languages_allowlist
-            and lang not in self.config.languages_allowlist
-        )
-        
-        # Check minimum engagement
-        reblogs_count = self._safe_count(status.get("reblogs_count", 0))
-        favourites_count = self._safe_count(status.get("favourites_count", 0))
-        replies_count = self._safe_count(status.get("replies_count", 0))
-        skip_low_reblogs = reblogs_count < self.config.min_reblogs
-        skip_low_favourites = favourites_count < self.config.min_favourites
-        skip_low_replies = replies_count < self.config.min_replies
-        
-        should_skip = (
-            skip_no_media
-            or skip_sensitive
-            or skip_language
-            or skip_low_reblogs
-            or skip_low_favourites
-            or skip_low_replies
-        )
-        
-        # Debug logging for filtering decision
-        if self.config.debug_decisions:
-            sid_display = sid[:8] + "..." if len(str(sid)) > 8 else str(sid)
-            self.debug_log.debug(f"STATUS {sid_display} | FILTER CHECK: {'SKIP' if should_skip else 'KEEP'}")
-            self.debug_log.debug(f"  Media attachments: {len(status.get('media_attachments', []))}")
-            self.debug_log.debug(f"  Skip no media: {skip_no_media} (require_media: {self.config.require_media})")
-            self.debug_log.debug(f"  Sensitive: {is_sensitive}, CW: '{spoiler_text}'")
-            self.debug_log.debug(f"  Skip sensitive: {skip_sensitive}")
-            self.debug_log.debug(f"  Language: '{lang}', allowlist: {self.config.languages_allowlist}")
-            self.debug_log.debug(f"  Skip language: {skip_language}")
-            self.debug_log.debug(f"  Reblogs: {reblogs_count} (min: {self.config.min_reblogs})")
-            self.debug_log.debug(f"  Skip low reblogs: {skip_low_reblogs}")
-            self.debug_log.debug(f"  Favourites: {favourites_count} (min: {self.config.min_favourites})")
-            self.debug_log.debug(f"  Skip low favourites: {skip_low_favourites}")
-            self.debug_log.debug(f"  Replies: {replies_count} (min: {self.config.min_replies})")
-            self.debug_log.debug(f"  Skip low replies: {skip_low_replies}")
-        
-        return should_skip
+                lang = detect_language(status)
+            return lang not in languages_allowlist
+
+        # The full walk is only needed to log every check
+        return should_skip if debug_decisions else first_failing_check
+
+    def _should_skip_status(self, status: dict) -> bool:
+        return self._skip(status)
 
     def _count_emojis(self, text: str) -> int:
         """Count Unicode emojis in text content."""
         if not text:
             return 0
-        # Unicode emoji regex pattern - match individual emojis
-        emoji_pattern = re.compile(
-            "["
-            "\U0001F600-\U0001F64F"  # emoticons
-            "\U0001F300-\U0001F5FF"  # symbols & pictographs
-            "\U0001F680-\U0001F6FF"  # transport & map symbols
-            "\U0001F1E0-\U0001F1FF"  # flags (iOS)
-            "\U00002702-\U000027B0"  # dingbats
-            "\U000024C2-\U0001F251"
-            "]"  # Remove the + to match individual emojis
-        )
-        matches = emoji_pattern.findall(text)
-        return len(matches)
+        return len(_EMOJI_RE.findall(text))
     
     def _has_links(self, text: str) -> bool:
         """Check if text contains URLs."""
         if not text:
             return False
-        # Simple URL detection pattern
-        url_pattern = re.compile(r'https?://[^\s<>"]+|www\.[^\s<>"]+')
-        return bool(url_pattern.search(text))
+        return _LINK_RE.search(text) is not None
+
+    def _build_related_matcher(self):
+        """
+        Compile every related term into one regex. The lookahead reports the
+        longest term starting at each position, including overlapping ones;
+        the closure maps that term to all related terms it contains, so the
+        result matches a plain substring test per term.
+        """
+        terms = {term for _, related in self._related_hashtags for term, _ in related}
+        if not terms:
+            return None, {}
+        ordered = sorted(terms, key=len, reverse=True)
+        pattern = re.compile("(?=(%s))" % "|".join(re.escape(term) for term in ordered))
+        closure = {term: frozenset(other for other in terms if other in term) for term in terms}
+        return pattern, closure
 
     def _calculate_related_hashtag_score(self, status: dict) -> float:
         """Calculate bonus score for hashtags related to configured keywords."""
-        if not self.config.related_hashtags:
+        if not self._related_hashtags:
             return 0
         
         # Get post content for analysis
         content = (status.get("content", "") or "").lower()
         # Also check hashtags themselves
-        hashtags = status.get("tags", [])
-        hashtag_names = [t.get("name", "").lower() for t in hashtags]
+        hashtag_names = self._tags_lc(status)
         all_text = content + " " + " ".join(hashtag_names)
         
+        # One scan finds every related term occurring in the text
+        closure = self._related_term_closure
+        present = set()
+        for match in self._related_terms_re.finditer(all_text):
+            present |= closure[match.group(1)]
+        
         related_score = 0
-        for main_hashtag, related_terms in self.config.related_hashtags.items():
-            main_hashtag_lower = main_hashtag.lower()
+        for main_hashtag_lower, related_terms in self._related_hashtags:
             # Check if the main hashtag is present
             if main_hashtag_lower in hashtag_names:
                 continue  # Already scored in regular hashtag scoring
             
             # Check for related terms in content
-            for related_term, multiplier in related_terms.items():
-                if related_term.lower() in all_text:
+            for related_term, multiplier in related_terms:
+                if related_term in present:
                     # Get the base score for the main hashtag
-                    base_score = self.config.hashtag_scores.get(main_hashtag_lower, 0)
-                    if base_score > 0:  # Only apply bonus for positive base scores
-                        bonus = base_score * float(multiplier)
-                        related_score += bonus
-                        break  # Only apply one bonus per main hashtag
+                    base_score = self._hashtag_scores[main_hashtag_lower]
+                    related_score += base_score * multiplier
+                    break  # Only apply one bonus per main hashtag
         
         return related_score
 
     def score_status(self, status: dict) -> float:
-        sid = status.get("id", "unknown")
-        
-        # Calculate hashtag score (now supports negative values)
-        hashtags = status.get("tags", [])
-        tag_scores = [
-            self.config.hashtag_scores.get(t.get("name", "").lower(), 0)
-            for t in hashtags
-        ]
-        tag_score = sum(tag_scores)
-        
-        # Calculate related hashtag bonuses
-        related_score = self._calculate_related_hashtag_score(status)
-        tag_score += related_score
-        
-        # Calculate engagement scores
-        reblogs_count = self._safe_count(status.get("reblogs_count", 0))
-        favourites_count = self._safe_count(status.get("favourites_count", 0))
-        replies_count = self._safe_count(status.get("replies_count", 0))
-        reblogs = math.log1p(reblogs_count) * 2
-        favourites = math.log1p(favourites_count)
-        replies = math.log1p(replies_count) * 1.5  # Weight replies between favorites and reblogs
-        
-        # Calculate media bonus
-        has_media = bool(status.get("media_attachments"))
-        media_bonus = self.config.prefer_media if has_media else 0
-        
-        # Calculate spam penalties
-        content = status.get("content", "") or ""
-        spam_penalty = 0
-        
-        # Emoji spam detection
-        emoji_count = self._count_emojis(content)
-        if emoji_count > self.config.spam_emoji_threshold:
-            excess_emojis = emoji_count - self.config.spam_emoji_threshold
-            spam_penalty += excess_emojis * self.config.spam_emoji_penalty
-        
-        # Link penalty
-        if self._has_links(content):
-            spam_penalty += self.config.spam_link_penalty
-        
-        # Calculate base score
-        base_score = tag_score + reblogs + favourites + replies + media_bonus - spam_penalty
-        
-        # Apply age decay if enabled
-        age_penalty = 0
-        if self.config.age_decay_enabled:
-            created_at = self._created_at(status)
-            now = datetime.now(timezone.utc)
-            age_hours = (now - created_at).total_seconds() / 3600
+        return self._score(status)
+
+    def _max_content_score(self):
+        """
+        Largest score a status can get beyond its engagement: every positive
+        hashtag weight, the best related bonus per main hashtag and the media
+        bonus. None when negative spam penalties make the bound unsafe.
+        """
+        if self.config.spam_emoji_penalty < 0 or self.config.spam_link_penalty < 0:
+            return None
+        ceiling = sum(score for score in self._hashtag_scores.values() if score > 0)
+        for main_hashtag_lower, related_terms in self._related_hashtags:
+            base_score = self._hashtag_scores[main_hashtag_lower]
+            ceiling += max([0.0] + [base_score * multiplier for _, multiplier in related_terms])
+        return ceiling + max(self.config.prefer_media, 0)
+
+    def _below_threshold_bound(self, status: dict) -> bool:
+        """
+        True when the status cannot reach min_score_threshold whatever its
+        content, so scoring (hashtags, related terms, emoji counting) is skipped.
+        Age decay only shrinks positive scores, so it never lifts a status over.
+        """
+        threshold = self.config.min_score_threshold
+        if threshold <= 0 or self._content_score_ceiling is None:
+            return False
+        engagement = (
+            math.log1p(self._safe_count(status.get("reblogs_count", 0))) * 2
+            + math.log1p(self._safe_count(status.get("favourites_count", 0)))
+            + math.log1p(self._safe_count(status.get("replies_count", 0))) * 1.5
+        )
+        return engagement + self._content_score_ceiling < threshold
+
+    def _make_scorer(self):
+        """
+        Build the scoring function behind score_status with the scoring config
+        values bound as locals, the same way _make_skip_predicate does for the
+        content filter. Spam scans whose penalty is zero are left out.
+        """
+        hashtag_scores = self._hashtag_scores
+        hashtag_score_keys = self._hashtag_score_keys
+        prefer_media = self.config.prefer_media
+        spam_emoji_threshold = self.config.spam_emoji_threshold
+        spam_emoji_penalty = self.config.spam_emoji_penalty
+        spam_link_penalty = self.config.spam_link_penalty
+        age_decay_enabled = self.config.age_decay_enabled
+        half_life_hours = self.config.age_decay_half_life_hours
+        debug_decisions = self.config.debug_decisions
+        debug_log = self.debug_log
+        tags_lc = self._tags_lc
+        related_hashtag_score = self._calculate_related_hashtag_score
+        safe_count = self._safe_count
+        count_emojis = self._count_emojis
+        links_in = self._has_links
+        created_at_of = self._created_at
+
+        def score(status: dict) -> float:
+            sid = status.get("id", "unknown")
             
-            # Calculate decay factor using half-life formula: decay = 0.5^(age/half_life)
-            if age_hours > 0 and self.config.age_decay_half_life_hours > 0:
-                decay_factor = 0.5 ** (age_hours / self.config.age_decay_half_life_hours)
-                age_penalty = base_score * (1 - decay_factor)
-        
-        total_score = base_score - age_penalty
-        
-        # Debug logging for scoring decision
-        if self.config.debug_decisions:
-            sid_display = sid[:8] + "..." if len(str(sid)) > 8 else str(sid)
-            self.debug_log.debug(f"STATUS {sid_display} | SCORING: {total_score:.2f}")
-            self.debug_log.debug(f"  Hashtags: {[t.get('name', '') for t in hashtags]}")
-            direct_tag_score = sum(tag_scores)
-            self.debug_log.debug(f"  Direct tag scores: {tag_scores} = {direct_tag_score}")
-            if related_score > 0:
-                self.debug_log.debug(f"  Related hashtag bonus: {related_score:.2f}")
-            self.debug_log.debug(f"  Total tag score: {tag_score:.2f}")
-            self.debug_log.debug(f"  Reblogs: {reblogs_count} -> {reblogs:.2f}")
-            self.debug_log.debug(f"  Favourites: {favourites_count} -> {favourites:.2f}")
-            self.debug_log.debug(f"  Replies: {replies_count} -> {replies:.2f}")
-            self.debug_log.debug(f"  Media bonus: {media_bonus} (has_media: {has_media})")
-            if spam_penalty > 0:
-                emoji_count = self._count_emojis(content)
-                has_links = self._has_links(content)
-                self.debug_log.debug(f"  Spam detection: {emoji_count} emojis, has_links: {has_links}, penalty: {spam_penalty:.2f}")
-            if self.config.age_decay_enabled:
-                created_at = self._created_at(status)
-                age_hours = (datetime.now(timezone.utc) - created_at).total_seconds() / 3600
-                decay_factor = 0.5 ** (age_hours / self.config.age_decay_half_life_hours) if age_hours > 0 else 1
-                self.debug_log.debug(f"  Age: {age_hours:.2f}h, decay factor: {decay_factor:.3f}, penalty: {age_penalty:.2f}")
-            self.debug_log.debug(f"  Total: {base_score:.2f} - {age_penalty:.2f} = {total_score:.2f}")
-        
-        return total_score
+            # Calculate hashtag score (now supports negative values)
+            hashtags = tags_lc(status)
+            # Only weighted tags contribute, so intersect before looking up
+            tag_scores = [hashtag_scores[tag] for tag in hashtags & hashtag_score_keys]
+            tag_score = sum(tag_scores)
+            
+            # Calculate related hashtag bonuses
+            related_score = related_hashtag_score(status)
+            tag_score += related_score
+            
+            # Calculate engagement scores
+            reblogs_count = safe_count(status.get("reblogs_count", 0))
+            favourites_count = safe_count(status.get("favourites_count", 0))
+            replies_count = safe_count(status.get("replies_count", 0))
+            reblogs = math.log1p(reblogs_count) * 2
+            favourites = math.log1p(favourites_count)
+            replies = math.log1p(replies_count) * 1.5  # Weight replies between favorites and reblogs
+            
+            # Calculate media bonus
+            has_media = bool(status.get("media_attachments"))
+            media_bonus = prefer_media if has_media else 0
+            
+            # Calculate spam penalties
+            content = status.get("content", "") or ""
+            spam_penalty = 0
+            
+            # Emoji spam detection (the scan is skipped when the penalty is off)
+            if spam_emoji_penalty:
+                emoji_count = count_emojis(content)
+                if emoji_count > spam_emoji_threshold:
+                    excess_emojis = emoji_count - spam_emoji_threshold
+                    spam_penalty += excess_emojis * spam_emoji_penalty
+            
+            # Link penalty
+            if spam_link_penalty and links_in(content):
+                spam_penalty += spam_link_penalty
+            
+            # Calculate base score
+            base_score = tag_score + reblogs + favourites + replies + media_bonus - spam_penalty
+            
+            # Apply age decay if enabled
+            age_penalty = 0
+            if age_decay_enabled:
+                created_at = created_at_of(status)
+                now = datetime.now(timezone.utc)
+                age_hours = (now - created_at).total_seconds() / 3600
+            
+                # Calculate decay factor using half-life formula: decay = 0.5^(age/half_life)
+                if age_hours > 0 and half_life_hours > 0:
+                    decay_factor = 0.5 ** (age_hours / half_life_hours)
+                    age_penalty = base_score * (1 - decay_factor)
+            
+            total_score = base_score - age_penalty
+            
+            # Debug logging for scoring decision
+            if debug_decisions:
+                sid_display = sid[:8] + "..." if len(str(sid)) > 8 else str(sid)
+                debug_log.debug("STATUS %s | SCORING: %.2f", sid_display, total_score)
+                debug_log.debug("  Hashtags: %s", sorted(hashtags))
+                direct_tag_score = sum(tag_scores)
+                debug_log.debug("  Direct tag scores: %s = %s", tag_scores, direct_tag_score)
+                if related_score > 0:
+                    debug_log.debug("  Related hashtag bonus: %.2f", related_score)
+                debug_log.debug("  Total tag score: %.2f", tag_score)
+                debug_log.debug("  Reblogs: %s -> %.2f", reblogs_count, reblogs)
+                debug_log.debug("  Favourites: %s -> %.2f", favourites_count, favourites)
+                debug_log.debug("  Replies: %s -> %.2f", replies_count, replies)
+                debug_log.debug("  Media bonus: %s (has_media: %s)", media_bonus, has_media)
+                if spam_penalty > 0:
+                    emoji_count = count_emojis(content)
+                    has_links = links_in(content)
+                    debug_log.debug("  Spam detection: %s emojis, has_links: %s, penalty: %.2f", emoji_count, has_links, spam_penalty)
+                if age_decay_enabled:
+                    created_at = created_at_of(status)
+                    age_hours = (datetime.now(timezone.utc) - created_at).total_seconds() / 3600
+                    decay_factor = 0.5 ** (age_hours / half_life_hours) if age_hours > 0 else 1
+                    debug_log.debug("  Age: %.2fh, decay factor: %.3f, penalty: %.2f", age_hours, decay_factor, age_penalty)
+                debug_log.debug("  Total: %.2f - %.2f = %.2f", base_score, age_penalty, total_score)
+            
+            return total_score
+
+        return score
 
     def _normalize_scores(self, entries):
         if not entries:
@@ -531,13 +862,29 @@ class Hype:
         for e in entries:
             e["score"] = (e["score"] - lo) / span * 100
 
+    def _rank_heap(self, entries):
+        """Min-heap yielding entries by score, then recency, then collection order."""
+        heap = [
+            (-e["score"], -self._created_at(e["status"]).timestamp(), i, e)
+            for i, e in enumerate(entries)
+        ]
+        heapq.heapify(heap)
+        return heap
+
     def _created_at(self, status):
+        """Creation time of a status, parsed once and kept on the status."""
+        created_at = status.get("_created_at")
+        if created_at is not None:
+            return created_at
         value = status.get("created_at")
         if isinstance(value, datetime):
             return value
         if not value:
-            return datetime.fromtimestamp(0, timezone.utc)
-        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+            created_at = datetime.fromtimestamp(0, timezone.utc)
+        else:
+            created_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        status["_created_at"] = created_at
+        return created_at
 
     def _fetch_status_from_remote(self, status_id: str, instance_name: str) -> dict:
         """
@@ -553,25 +900,35 @@ class Hype:
             
             if self.config.debug_decisions:
                 sid_display = str(status_id)[:8] + "..." if len(str(status_id)) > 8 else str(status_id)
-                self.debug_log.debug(f"Remote fetch successful for {sid_display} from {instance_name}")
+                self.debug_log.debug("Remote fetch successful for %s from %s", sid_display, instance_name)
             
             return status
         except MastodonNotFoundError:
             if self.config.debug_decisions:
                 sid_display = str(status_id)[:8] + "..." if len(str(status_id)) > 8 else str(status_id)
-                self.debug_log.info(f"Remote status {sid_display} not found (404) on {instance_name}")
+                self.debug_log.info("Remote status %s not found (404) on %s", sid_display, instance_name)
             return None
         except MastodonAPIError as e:
-            self.log.warning(f"{instance_name}: Remote fetch error for status {status_id} - {e}")
+            self.log.warning("%s: Remote fetch error for status %s - %s", instance_name, status_id, e)
             if self.config.debug_decisions:
-                self.debug_log.warning(f"Remote fetch API error: {e}")
+                self.debug_log.warning("Remote fetch API error: %s", e)
             return None
         except Exception as e:
-            self.log.error(f"{instance_name}: Unexpected error fetching status {status_id} - {e}")
+            self.log.error("%s: Unexpected error fetching status %s - %s", instance_name, status_id, e)
             if self.config.debug_decisions:
-                self.debug_log.error(f"Remote fetch unexpected error: {e}")
+                self.debug_log.error("Remote fetch unexpected error: %s", e)
             return None
 
+    def _federate(self, uri: str, sid_display: str) -> dict:
+        """search_v2(resolve=True), retried once after a short pause if the server returns a 500."""
+        try:
+            return self.client.search_v2(uri, result_type="statuses", resolve=True)
+        except MastodonInternalServerError as err:
+            if self.config.debug_decisions:
+                self.debug_log.debug("Federation search for %s hit a server error, retrying once - %s", sid_display, err)
+            time.sleep(self.SEARCH_RETRY_DELAY_SECONDS)
+            return self.client.search_v2(uri, result_type="statuses", resolve=True)
+
     def _attempt_reblog_with_federation_fallback(self, status: dict, instance_name: str) -> tuple:
         """
         Attempt to reblog a status with federation fallback if needed.
@@ -588,93 +945,91 @@ class Hype:
         uri = status.get("uri") or status.get("url")
         
         if not uri:
-            self.log.warning(f"{instance_name}: Cannot process status {status_id}, missing URI")
+            self.log.warning("%s: Cannot process status %s, missing URI", instance_name, status_id)
             if self.config.debug_decisions:
-                self.debug_log.warning(f"DECISION: SKIP - Missing URI")
+                self.debug_log.warning("DECISION: SKIP - Missing URI")
             return (False, None)
         
         # Attempt 1: Try direct reblog (status may already be in local DB)
         try:
             self.client.status_reblog(status)
             if self.config.debug_decisions:
-                self.debug_log.debug(f"Direct reblog successful for {sid_display} (already in local DB)")
+                self.debug_log.debug("Direct reblog successful for %s (already in local DB)", sid_display)
             return (True, status)
         except MastodonNotFoundError:
             # Status not in local DB (404 on reblog)
             if self.config.debug_decisions:
-                self.debug_log.debug(f"Status {sid_display} not in local DB (404 on reblog attempt)")
+                self.debug_log.debug("Status %s not in local DB (404 on reblog attempt)", sid_display)
             
             # Attempt 2: Try to federate via search with resolve=True
             if self.config.debug_decisions:
-                self.debug_log.debug(f"Attempting to federate {sid_display} via search(resolve=True)")
+                self.debug_log.debug("Attempting to federate %s via search(resolve=True)", sid_display)
             
             try:
-                result = self.client.search_v2(
-                    uri, result_type="statuses", resolve=True
-                ).get("statuses", [])
+                result = self._federate(uri, sid_display).get("statuses", [])
                 
                 if not result:
                     # Search with resolve=True returned empty
-                    self.log.info(f"{instance_name}: skip, resolve-empty (status exists remotely but couldn't be federated)")
+                    self.log.info("%s: skip, resolve-empty (status exists remotely but couldn't be federated)", instance_name)
                     if self.config.debug_decisions:
-                        self.debug_log.info(f"DECISION: SKIP - remote-200-local-resolve-empty")
+                        self.debug_log.info("DECISION: SKIP - remote-200-local-resolve-empty")
                     return (False, None)
                 
                 # Federation succeeded, retry reblog with federated status
                 federated_status = result[0]
                 if self.config.debug_decisions:
-                    self.debug_log.debug(f"Federation successful for {sid_display}, retrying reblog")
+                    self.debug_log.debug("Federation successful for %s, retrying reblog", sid_display)
                 
                 try:
                     self.client.status_reblog(federated_status)
                     if self.config.debug_decisions:
-                        self.debug_log.debug(f"Reblog after federation successful for {sid_display}")
+                        self.debug_log.debug("Reblog after federation successful for %s", sid_display)
                     return (True, federated_status)
                 except MastodonAPIError as reblog_error:
-                    self.log.warning(f"{instance_name}: Reblog failed after federation - {reblog_error}")
+                    self.log.warning("%s: Reblog failed after federation - %s", instance_name, reblog_error)
                     if self.config.debug_decisions:
-                        self.debug_log.warning(f"DECISION: SKIP - reblog-404-after-resolve")
+                        self.debug_log.warning("DECISION: SKIP - reblog-404-after-resolve")
                     return (False, None)
                     
             except MastodonAPIError as e:
-                self.log.warning(f"{instance_name}: Federation attempt failed - {e}")
+                self.log.warning("%s: Federation attempt failed - %s", instance_name, e)
                 if self.config.debug_decisions:
                     if "401" in str(e) or "Unauthorized" in str(e):
-                        self.debug_log.warning(f"DECISION: SKIP - token-scope-missing")
+                        self.debug_log.warning("DECISION: SKIP - token-scope-missing")
                     else:
-                        self.debug_log.warning(f"DECISION: SKIP - resolve-rejected ({e})")
+                        self.debug_log.warning("DECISION: SKIP - resolve-rejected (%s)", e)
                 return (False, None)
             except Exception as e:
-                self.log.error(f"{instance_name}: Unexpected error during federation - {e}")
+                self.log.error("%s: Unexpected error during federation - %s", instance_name, e)
                 if self.config.debug_decisions:
-                    self.debug_log.error(f"DECISION: SKIP - federation-error ({e})")
+                    self.debug_log.error("DECISION: SKIP - federation-error (%s)", e)
                 return (False, None)
                 
         except MastodonAPIError as e:
-            self.log.warning(f"{instance_name}: Reblog attempt failed - {e}")
+            self.log.warning("%s: Reblog attempt failed - %s", instance_name, e)
             if self.config.debug_decisions:
-                self.debug_log.warning(f"DECISION: SKIP - reblog-error ({e})")
+                self.debug_log.warning("DECISION: SKIP - reblog-error (%s)", e)
             return (False, None)
         except Exception as e:
-            self.log.error(f"{instance_name}: Unexpected error during reblog - {e}")
+            self.log.error("%s: Unexpected error during reblog - %s", instance_name, e)
             if self.config.debug_decisions:
-                self.debug_log.error(f"DECISION: SKIP - reblog-unexpected-error ({e})")
+                self.debug_log.error("DECISION: SKIP - reblog-unexpected-error (%s)", e)
             return (False, None)
 
     def boost(self):
         self.log.info("Run boost")
         
         # Reset hashtag tracking for current run
-        self._hashtags_boosted_this_run = []
+        self._hashtags_boosted_this_run = Counter()
         
         # Debug: Log boost cycle start
         if self.config.debug_decisions:
             self.debug_log.info("=== BOOST CYCLE START ===")
-            self.debug_log.info(f"Daily cap: {self.state.get('day_count', 0)}/{self.config.daily_public_cap}")
-            self.debug_log.info(f"Hourly cap: {self.state.get('hour_count', 0)}/{self.config.per_hour_public_cap}")
-            self.debug_log.info(f"Max boosts per run: {self.config.max_boosts_per_run}")
+            self.debug_log.info("Daily cap: %s/%s", self.state.get('day_count', 0), self.config.daily_public_cap)
+            self.debug_log.info("Hourly cap: %s/%s", self.state.get('hour_count', 0), self.config.per_hour_public_cap)
+            self.debug_log.info("Max boosts per run: %s", self.config.max_boosts_per_run)
             if self.config.hashtag_diversity_enforced:
-                self.debug_log.info(f"Hashtag diversity: max {self.config.max_boosts_per_hashtag_per_run} per hashtag per run")
+                self.debug_log.info("Hashtag diversity: max %s per hashtag per run", self.config.max_boosts_per_hashtag_per_run)
         
         if not self.config.subscribed_instances and not self.config.local_timeline_enabled:
             self.log.warning("No subscribed instances configured and local timeline is disabled.")
@@ -688,52 +1043,120 @@ class Hype:
             instance_count = len(self.config.subscribed_instances)
             if self.config.local_timeline_enabled:
                 instance_count += 1
-            self.debug_log.info(f"Fetching from {instance_count} sources:")
+            self.debug_log.info("Fetching from %s sources:", instance_count)
             for inst in self.config.subscribed_instances:
                 fetch_lim = getattr(inst, 'fetch_limit', getattr(inst, 'limit', 20))
                 boost_lim = getattr(inst, 'boost_limit', getattr(inst, 'limit', 4))
-                self.debug_log.info(f"  - {inst.name} (fetch: {fetch_lim}, boost: {boost_lim})")
+                self.debug_log.info("  - %s (fetch: %s, boost: %s)", inst.name, fetch_lim, boost_lim)
             if self.config.local_timeline_enabled:
-                self.debug_log.info(f"  - local (fetch: {self.config.local_timeline_fetch_limit}, boost: {self.config.local_timeline_boost_limit})")
+                self.debug_log.info("  - local (fetch: %s, boost: %s)", self.config.local_timeline_fetch_limit, self.config.local_timeline_boost_limit)
                 
         collected = []
+        # Statuses boosted in earlier cycles are dropped before scoring
+        already_seen = 0
+        # Statuses under min_score_threshold, including those whose engagement
+        # rules it out before scoring
+        below_threshold = 0
+        # Clients are resolved here, in subscription order (they are cached
+        # after the first cycle), so only the trending requests run in threads
+        instances = []
+        clients = []
+        queued = set()
         for inst in self.config.subscribed_instances:
-            statuses = self._fetch_trending_statuses(inst)
+            # An instance listed twice would return the same trending list, so
+            # only its first entry is fetched
+            if inst.name in queued:
+                if self.config.debug_decisions:
+                    self.debug_log.debug("Instance %s listed more than once, fetching it once", inst.name)
+                continue
+            queued.add(inst.name)
+            client = self._resolve_client(inst.name)
+            if client is not None:
+                instances.append(inst)
+                clients.append(client)
+        fetched = []
+        local_statuses = []
+        # A zero fetch or boost budget can't produce a local boost, so skip the request
+        local_enabled = (
+            self.config.local_timeline_enabled
+            and self.config.local_timeline_fetch_limit > 0
+            and self.config.local_timeline_boost_limit > 0
+        )
+        fetches = len(instances) + (1 if local_enabled else 0)
+        if fetches:
+            # Each fetch, the local timeline included, is an independent network
+            # call, so overlap them; the scoring and boosting below stays serial
+            workers = min(self.MAX_FETCH_WORKERS, fetches)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                local_future = executor.submit(self._fetch_local_timeline_statuses) if local_enabled else None
+                fetched = list(executor.map(self._fetch_trending_statuses, instances, clients))
+                if local_future is not None:
+                    local_statuses = local_future.result()
+        if not local_statuses and not any(fetched):
+            self.log.info("No statuses fetched from any source. Skipping boost cycle.")
             if self.config.debug_decisions:
-                self.debug_log.info(f"Instance {inst.name}: fetched {len(statuses)} statuses")
-            for entry in statuses:
-                s = entry["status"]
-                entry["score"] = self.score_status(s)
-                # Store the boost_limit for this instance with each entry
-                # Support backward compatibility: if no boost_limit, use limit (old behavior)
-                entry["instance_boost_limit"] = getattr(inst, 'boost_limit', getattr(inst, 'limit', 4))
-                collected.append(entry)
-        
-        # Fetch from local timeline if enabled
-        if self.config.local_timeline_enabled:
-            local_statuses = self._fetch_local_timeline_statuses()
+                self.debug_log.info("BOOST CYCLE SKIPPED: Nothing fetched")
+            return
+        # Per-source boost limits, kept once per source rather than on every entry
+        boost_limits = {}
+        batches = []
+        for inst, statuses in zip(instances, fetched):
+            if self.config.debug_decisions:
+                self.debug_log.info("Instance %s: fetched %s statuses", inst.name, len(statuses))
+            # Support backward compatibility: if no boost_limit, use limit (old behavior)
+            boost_limits[inst.name] = getattr(inst, 'boost_limit', getattr(inst, 'limit', 4))
+            batches.append(statuses)
+        
+        # Local timeline, fetched alongside the remote instances
+        if local_enabled:
             if self.config.debug_decisions:
-                self.debug_log.info(f"Instance local: fetched {len(local_statuses)} statuses")
-            for entry in local_statuses:
+                self.debug_log.info("Instance local: fetched %s statuses", len(local_statuses))
+            boost_limits["local"] = self.config.local_timeline_boost_limit
+            batches.append(local_statuses)
+        
+        # A post trending on several instances is scored once, using the copy
+        # that reports the most engagement; the other copies stay on it as
+        # fallbacks for when that copy's source is out of boosts
+        unique = {}
+        duplicates = 0
+        for statuses in batches:
+            for entry in statuses:
                 s = entry["status"]
-                entry["score"] = self.score_status(s)
-                entry["instance_boost_limit"] = self.config.local_timeline_boost_limit
-                collected.append(entry)
+                key = s.get("uri") or s.get("url") or id(entry)
+                kept = unique.get(key)
+                if kept is None:
+                    unique[key] = entry
+                    continue
+                duplicates += 1
+                if self._engagement_counts(s) > self._engagement_counts(kept["status"]):
+                    entry["copies"] = kept.pop("copies", []) + [kept]
+                    unique[key] = entry
+                else:
+                    kept.setdefault("copies", []).append(entry)
+        
+        # Score and apply the quality threshold (on raw scores, before
+        # normalization) in one pass
+        threshold = self.config.min_score_threshold
+        for entry in unique.values():
+            s = entry["status"]
+            if self._in_seen_cache(s):
+                already_seen += 1
+                continue
+            if self._below_threshold_bound(s):
+                below_threshold += 1
+                continue
+            score = self.score_status(s)
+            if threshold > 0 and score < threshold:
+                below_threshold += 1
+                continue
+            entry["score"] = score
+            collected.append(entry)
                 
         # Debug: Log collection results
         if self.config.debug_decisions:
-            self.debug_log.info(f"Total collected statuses: {len(collected)}")
-        
-        # Apply quality threshold filtering on raw scores (before normalization)
-        if self.config.min_score_threshold > 0:
-            qualified_collected = [
-                entry for entry in collected 
-                if entry["score"] >= self.config.min_score_threshold
-            ]
-            if self.config.debug_decisions:
-                filtered_count = len(collected) - len(qualified_collected)
-                self.debug_log.info(f"Quality threshold filter (raw scores): {filtered_count} posts below {self.config.min_score_threshold} threshold")
-            collected = qualified_collected
+            self.debug_log.info("Total collected statuses: %s (%s already seen, not scored; %s duplicates across sources)", len(collected) + below_threshold, already_seen, duplicates)
+            if threshold > 0:
+                self.debug_log.info("Quality threshold filter (raw scores): %s posts below %s threshold", below_threshold, threshold)
         
         # Check if we have any qualifying content
         if not collected:
@@ -743,91 +1166,105 @@ class Hype:
             return
 
         self._normalize_scores(collected)
-        collected.sort(
-            key=lambda e: (e["score"], self._created_at(e["status"])),
-            reverse=True,
-        )
+        # Candidates are popped best-first; most cycles stop after a handful,
+        # so only the entries actually examined pay for ordering
+        ranked = self._rank_heap(collected)
         
         # Debug: Log top candidates after scoring and filtering
         if self.config.debug_decisions:
             self.debug_log.info("=== TOP CANDIDATES AFTER SCORING AND FILTERING ===")
-            for i, entry in enumerate(collected[:10]):  # Show top 10
+            for i, (*_, entry) in enumerate(heapq.nsmallest(10, ranked)):  # Show top 10
                 status = entry["status"]
                 sid = status.get("id", "unknown")
                 author = status.get("account", {}).get("acct", "unknown")
                 score = entry["score"]
                 sid_display = sid[:8] + "..." if len(str(sid)) > 8 else str(sid)
-                self.debug_log.info(f"#{i+1}: {sid_display} by {author} - score: {score:.2f}")
+                self.debug_log.info("#%s: %s by %s - score: %.2f", i+1, sid_display, author, score)
         
         total = len(collected)
         boosted = 0
-        instance_boost_counts = {}  # Track boosts per instance in this run
+        # Boosts left per source this run; once every source is spent the rest
+        # of the heap can't produce a boost
+        remaining = {name: max(limit, 0) for name, limit in boost_limits.items()}
+        budget_left = sum(remaining.values())
         
         # Debug: Log boost decision loop start
         if self.config.debug_decisions:
             self.debug_log.info("=== BOOST DECISION LOOP ===")
         
-        for entry in collected:
+        while ranked:
+            entry = heapq.heappop(ranked)[-1]
             if boosted >= self.config.max_boosts_per_run or not self._public_cap_available():
                 if self.config.debug_decisions:
                     reason = "max boosts reached" if boosted >= self.config.max_boosts_per_run else "public cap reached"
-                    self.debug_log.info(f"Breaking early: {reason}")
+                    self.debug_log.info("Breaking early: %s", reason)
+                break
+            if not budget_left:
+                if self.config.debug_decisions:
+                    self.debug_log.info("Breaking early: every instance boost limit reached")
                 break
                 
             trending = entry["status"]
             sid = trending.get("id", "unknown")
             instance_name = entry["instance"]
-            instance_boost_limit = entry.get("instance_boost_limit", 4)
             score = entry["score"]
             
-            # Check per-instance boost limit
-            instance_boosts = instance_boost_counts.get(instance_name, 0)
-            if instance_boosts >= instance_boost_limit:
+            # Check per-instance boost limit, falling back to a copy of the
+            # post from a source that still has boosts left
+            if not remaining[instance_name]:
+                copy = next((c for c in entry.get("copies", ()) if remaining[c["instance"]]), None)
+                if copy is not None:
+                    if self.config.debug_decisions:
+                        self.debug_log.info("Instance %s boost limit reached, using the copy from %s", instance_name, copy["instance"])
+                    trending = copy["status"]
+                    sid = trending.get("id", "unknown")
+                    instance_name = copy["instance"]
+            if not remaining[instance_name]:
                 if self.config.debug_decisions:
                     sid_display = str(sid)[:8] + "..." if len(str(sid)) > 8 else str(sid)
-                    self.debug_log.info(f"--- SKIPPING STATUS {sid_display} ---")
-                    self.debug_log.info(f"From: {instance_name}, Reason: Instance boost limit reached ({instance_boosts}/{instance_boost_limit})")
+                    instance_boost_limit = boost_limits[instance_name]
+                    self.debug_log.info("--- SKIPPING STATUS %s ---", sid_display)
+                    self.debug_log.info("From: %s, Reason: Instance boost limit reached (%s/%s)", instance_name, instance_boost_limit, instance_boost_limit)
                 continue
             
             # Debug: Log candidate evaluation
             if self.config.debug_decisions:
                 sid_display = str(sid)[:8] + "..." if len(str(sid)) > 8 else str(sid)
-                self.debug_log.info(f"--- EVALUATING STATUS {sid_display} ---")
-                self.debug_log.info(f"From: {instance_name}, Score: {score:.2f}")
+                self.debug_log.info("--- EVALUATING STATUS %s ---", sid_display)
+                self.debug_log.info("From: %s, Score: %.2f", instance_name, score)
             
             # Step 1: Apply filters on the trending status (before attempting any network calls)
             # Use the trending status directly - it's already a full status object from the remote
             status = trending
             
             if self._seen_status(status):
-                self.log.info(f"{instance_name}: already boosted, skip")
+                self.log.info("%s: already boosted, skip", instance_name)
                 if self.config.debug_decisions:
-                    self.debug_log.info(f"DECISION: SKIP - Already seen/boosted")
+                    self.debug_log.info("DECISION: SKIP - Already seen/boosted")
                 continue
                 
-            acct = status.get("account", {}).get("acct", "").split("@")
-            server = acct[-1] if len(acct) > 1 else ""
-            if server in self.config.filtered_instances:
-                self.log.info(f"{instance_name}: filtered instance {server}, skip")
+            _, sep, server = status.get("account", {}).get("acct", "").rpartition("@")
+            if sep and server in self._filtered_instances:
+                self.log.info("%s: filtered instance %s, skip", instance_name, server)
                 if self.config.debug_decisions:
-                    self.debug_log.info(f"DECISION: SKIP - Instance {server} is filtered")
+                    self.debug_log.info("DECISION: SKIP - Instance %s is filtered", server)
                 continue
                 
             if self._should_skip_status(status):
-                self.log.info(f"{instance_name}: filtered by rules, skip")
+                self.log.info("%s: filtered by rules, skip", instance_name)
                 if self.config.debug_decisions:
-                    self.debug_log.info(f"DECISION: SKIP - Filtered by content rules")
+                    self.debug_log.info("DECISION: SKIP - Filtered by content rules")
                 continue
             
             # Step 2: Attempt reblog with federation fallback
             if self.config.debug_decisions:
-                self.debug_log.info(f"DECISION: BOOST - Status passes all checks")
+                self.debug_log.info("DECISION: BOOST - Status passes all checks")
                 author = status.get("account", {}).get("acct", "unknown")
                 content_preview = (status.get("content", "") or "").strip()[:100]
                 if len(content_preview) > 97:
                     content_preview = content_preview[:97] + "..."
-                self.debug_log.info(f"  Author: {author}")
-                self.debug_log.info(f"  Content: {content_preview}")
+                self.debug_log.info("  Author: %s", author)
+                self.debug_log.info("  Content: %s", content_preview)
             
             success, tracked_status = self._attempt_reblog_with_federation_fallback(status, instance_name)
             if not success:
@@ -836,13 +1273,15 @@ class Hype:
             # Use tracked_status for memory (may be different if federated)
             self._count_public_boost()
             self._remember_status(tracked_status if tracked_status else status)
-            self._save_state()
+            self._log_boost(tracked_status if tracked_status else status)
             boosted += 1
-            instance_boost_counts[instance_name] = instance_boost_counts.get(instance_name, 0) + 1
-            self.log.info(f"{instance_name}: boosted {boosted}/{total}")
+            remaining[instance_name] -= 1
+            budget_left -= 1
+            self.log.info("%s: boosted %s/%s", instance_name, boosted, total)
             
             if self.config.debug_decisions:
-                self.debug_log.info(f"Instance {instance_name}: {instance_boost_counts[instance_name]}/{instance_boost_limit} boosts from this instance")
+                instance_boost_limit = boost_limits[instance_name]
+                self.debug_log.info("Instance %s: %s/%s boosts from this instance", instance_name, instance_boost_limit - remaining[instance_name], instance_boost_limit)
             
             if self.state["hour_count"] >= self.config.per_hour_public_cap:
                 self.log.info("Per-hour public cap reached, stopping early.")
@@ -853,26 +1292,38 @@ class Hype:
         # Debug: Log boost cycle summary
         if self.config.debug_decisions:
             self.debug_log.info("=== BOOST CYCLE COMPLETE ===")
-            self.debug_log.info(f"Boosted: {boosted} posts")
-            self.debug_log.info(f"Daily count: {self.state.get('day_count', 0)}/{self.config.daily_public_cap}")
-            self.debug_log.info(f"Hourly count: {self.state.get('hour_count', 0)}/{self.config.per_hour_public_cap}")
+            self.debug_log.info("Boosted: %s posts", boosted)
+            self.debug_log.info("Daily count: %s/%s", self.state.get('day_count', 0), self.config.daily_public_cap)
+            self.debug_log.info("Hourly count: %s/%s", self.state.get('hour_count', 0), self.config.per_hour_public_cap)
+
+    def _resolve_client(self, instance_name: str):
+        try:
+            return self.init_client(instance_name)
+        except Exception as err:
+            self.log.error("%s: error - %s", instance_name, err)
+            if self.config.debug_decisions:
+                self.debug_log.error("Failed to initialize client for %s: %s", instance_name, err)
+            return None
 
-    def _fetch_trending_statuses(self, instance):
+    def _fetch_trending_statuses(self, instance, client=None):
         try:
             # Support both old-style instances (with limit) and new-style (with fetch_limit)
             fetch_limit = getattr(instance, 'fetch_limit', getattr(instance, 'limit', 20))
             if self.config.debug_decisions:
-                self.debug_log.debug(f"Fetching trending statuses from {instance.name} (fetch_limit: {fetch_limit})")
-            client = self.init_client(instance.name)
+                self.debug_log.debug("Fetching trending statuses from %s (fetch_limit: %s)", instance.name, fetch_limit)
+            if client is None:
+                client = self.init_client(instance.name)
             statuses = client.trending_statuses(limit=fetch_limit)
             result = [{"instance": instance.name, "status": s} for s in statuses]
             if self.config.debug_decisions:
-                self.debug_log.debug(f"Successfully fetched {len(result)} statuses from {instance.name}")
+                self.debug_log.debug("Successfully fetched %s statuses from %s", len(result), instance.name)
             return result
         except Exception as err:
-            self.log.error(f"{instance.name}: error - {err}")
+            self.log.error("%s: error - %s", instance.name, err)
             if self.config.debug_decisions:
-                self.debug_log.error(f"Failed to fetch from {instance.name}: {err}")
+                self.debug_log.error("Failed to fetch from %s: %s", instance.name, err)
+            # Don't keep reusing a client that just failed; rebuild it next cycle
+            self.invalidate_client(instance.name)
             return []
 
     def _fetch_local_timeline_statuses(self):
@@ -880,65 +1331,84 @@ class Hype:
         try:
             fetch_limit = self.config.local_timeline_fetch_limit
             if self.config.debug_decisions:
-                self.debug_log.debug(f"Fetching local timeline statuses (fetch_limit: {fetch_limit})")
+                self.debug_log.debug("Fetching local timeline statuses (fetch_limit: %s)", fetch_limit)
             
             # Use the bot's own client to fetch local timeline
             statuses = self.client.timeline_local(limit=fetch_limit)
             
-            # Get current day for filtering
-            now = datetime.now(timezone.utc)
-            today_key = now.strftime("%Y-%m-%d")
+            # Bounds of the current UTC day, computed once for the whole page
+            today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+            tomorrow_start = today_start + timedelta(days=1)
+            
+            min_engagement = self.config.local_timeline_min_engagement
+            created_at_of = self._created_at
+            safe_count = self._safe_count
             
             result = []
             for status in statuses:
                 # Filter 1: Check if post is from today
-                created_at = self._created_at(status)
-                post_day = created_at.strftime("%Y-%m-%d")
-                if post_day != today_key:
+                if not today_start <= created_at_of(status) < tomorrow_start:
                     continue
                 
                 # Filter 2: Check engagement (at least 1 boost, star, or comment)
-                reblogs = self._safe_count(status.get("reblogs_count", 0))
-                favourites = self._safe_count(status.get("favourites_count", 0))
-                replies = self._safe_count(status.get("replies_count", 0))
+                reblogs = safe_count(status.get("reblogs_count", 0))
+                favourites = safe_count(status.get("favourites_count", 0))
+                replies = safe_count(status.get("replies_count", 0))
                 total_engagement = reblogs + favourites + replies
                 
-                if total_engagement < self.config.local_timeline_min_engagement:
+                if total_engagement < min_engagement:
                     continue
                 
                 result.append({"instance": "local", "status": status})
             
             if self.config.debug_decisions:
-                self.debug_log.debug(f"Successfully fetched {len(result)} qualifying statuses from local timeline (from {len(statuses)} total)")
+                self.debug_log.debug("Successfully fetched %s qualifying statuses from local timeline (from %s total)", len(result), len(statuses))
             return result
         except Exception as err:
-            self.log.error(f"local timeline: error - {err}")
+            self.log.error("local timeline: error - %s", err)
             if self.config.debug_decisions:
-                self.debug_log.error(f"Failed to fetch from local timeline: {err}")
+                self.debug_log.error("Failed to fetch from local timeline: %s", err)
             return []
 
 
     def start(self):
-        self.boost()
-        self.log.info(f"Schedule run every {self.config.interval} minutes")
-        schedule.every(self.config.interval).minutes.do(self.boost)
-        while True:
-            schedule.run_pending()
-            time.sleep(1)
+        # docker stop sends SIGTERM; turn it into SystemExit so the final
+        # checkpoint below still runs
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        try:
+            self.boost()
+            self.log.info("Schedule run every %s minutes", self.config.interval)
+            schedule.every(self.config.interval).minutes.do(self.boost)
+            while True:
+                schedule.run_pending()
+                time.sleep(1)
+        finally:
+            self.log.info("Shutting down, saving state")
+            self._save_state()
 
     def init_client(self, instance_name: str) -> Mastodon:
+        # Reuse the client (and its HTTP session) built in an earlier cycle
+        cached = self._clients.get(instance_name)
+        if cached is not None and time.monotonic() - cached[0] < self.CLIENT_TTL_SECONDS:
+            return cached[1]
         secret_path = f"secrets/{instance_name}_clientcred.secret"
         if not os.path.isfile(secret_path):
-            self.log.info(f"Initialize client for {instance_name}")
+            self.log.info("Initialize client for %s", instance_name)
             Mastodon.create_app(
                 instance_name,
                 api_base_url=f"https://{instance_name}",
                 to_file=secret_path,
             )
         else:
-            self.log.info(f"Client for {instance_name} is already initialized.")
-        return Mastodon(
+            self.log.info("Client for %s is already initialized.", instance_name)
+        client = Mastodon(
             client_id=secret_path,
             ratelimit_method="pace",
         )
+        self._clients[instance_name] = (time.monotonic(), client)
+        return client
+
+    def invalidate_client(self, instance_name: str) -> None:
+        """Drop the cached client for an instance so the next use builds a fresh one."""
+        self._clients.pop(instance_name, None)
 
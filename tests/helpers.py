@@ -0,0 +1,194 @@
+"""Shared test helpers: config stand-in, status builder and fake Mastodon clients."""
+import types
+
+from hype.config import Instance
+from hype.hype import Hype
+
+
+class DummyConfig:
+    """
+    Config stand-in; tests override individual attributes after construction.
+    Without a path the state is kept in memory only, for tests that never persist it.
+    """
+
+    # Slots, so a misspelled setting in a test raises instead of being ignored
+    __slots__ = (
+        "state_path",
+        "bot_account",
+        "log_level",
+        "debug_decisions",
+        "logfile_path",
+        "profile_prefix",
+        "daily_public_cap",
+        "per_hour_public_cap",
+        "max_boosts_per_run",
+        "max_boosts_per_author_per_day",
+        "author_diversity_enforced",
+        "prefer_media",
+        "require_media",
+        "skip_sensitive_without_cw",
+        "min_reblogs",
+        "min_favourites",
+        "min_replies",
+        "use_mastodon_language_detection",
+        "seen_cache_size",
+        "age_decay_enabled",
+        "age_decay_half_life_hours",
+        "hashtag_diversity_enforced",
+        "max_boosts_per_hashtag_per_run",
+        "spam_emoji_penalty",
+        "spam_emoji_threshold",
+        "spam_link_penalty",
+        "min_score_threshold",
+        "local_timeline_enabled",
+        "local_timeline_fetch_limit",
+        "local_timeline_boost_limit",
+        "local_timeline_min_engagement",
+        "subscribed_instances",
+        "filtered_instances",
+        "fields",
+        "languages_allowlist",
+        "hashtag_scores",
+        "related_hashtags",
+    )
+
+    def __init__(self, path=""):
+        self.state_path = path
+        self.bot_account = types.SimpleNamespace(server="s", access_token="t")
+        self.log_level = "ERROR"
+        self.debug_decisions = False
+        self.logfile_path = ""
+        self.profile_prefix = ""
+        self.daily_public_cap = 10
+        self.per_hour_public_cap = 10
+        self.max_boosts_per_run = 10
+        self.max_boosts_per_author_per_day = 10
+        self.author_diversity_enforced = False  # Disabled by default for tests
+        self.prefer_media = False
+        self.require_media = False
+        self.skip_sensitive_without_cw = False
+        self.min_reblogs = 0
+        self.min_favourites = 0
+        self.min_replies = 0
+        self.use_mastodon_language_detection = False  # Use langdetect by default
+        self.seen_cache_size = 6000
+        # Age decay and hashtag diversity configuration
+        self.age_decay_enabled = False
+        self.age_decay_half_life_hours = 24.0
+        self.hashtag_diversity_enforced = False
+        self.max_boosts_per_hashtag_per_run = 1
+        # Spam detection configuration
+        self.spam_emoji_penalty = 0
+        self.spam_emoji_threshold = 2
+        self.spam_link_penalty = 0
+        # Quality threshold configuration
+        self.min_score_threshold = 0
+        # Local timeline configuration
+        self.local_timeline_enabled = True
+        self.local_timeline_fetch_limit = 20
+        self.local_timeline_boost_limit = 2
+        self.local_timeline_min_engagement = 1
+        # Containers are per instance so one test can't leak into another
+        self.subscribed_instances = []
+        self.filtered_instances = []
+        self.fields = {}
+        self.languages_allowlist = []
+        self.hashtag_scores = {}
+        # Related hashtag scoring configuration
+        self.related_hashtags = {}
+
+
+_STATUS_TEMPLATE = {
+    "id": None,
+    "url": None,
+    "uri": None,
+    "reblogged": False,
+    "account": {"acct": "a@b"},
+    "media_attachments": [1],
+    "sensitive": False,
+    "spoiler_text": "",
+    "language": "en",
+    "content": "",  # Add content field for spam detection tests
+}
+
+
+def status_data(i, u):
+    status = _STATUS_TEMPLATE.copy()
+    status["id"] = i
+    status["url"] = status["uri"] = u
+    # Tests mutate the result (tags, account), so copy the nested containers too
+    status["account"] = dict(status["account"])
+    status["media_attachments"] = list(status["media_attachments"])
+    return status
+
+
+def stub_client(trending=()):
+    """Remote instance client serving a fixed trending list, lighter than a MagicMock."""
+    return types.SimpleNamespace(trending_statuses=lambda limit=None: list(trending))
+
+
+def make_hype(tmp_path=None, **settings):
+    """
+    Hype over a DummyConfig with the given settings applied. Its state lives in
+    tmp_path, or only in memory when no tmp_path is given.
+    """
+    cfg = DummyConfig(str(tmp_path / "state.json") if tmp_path is not None else "")
+    for name, value in settings.items():
+        setattr(cfg, name, value)
+    return Hype(cfg)
+
+
+def boost_harness(trending, client=None, limit=1, tmp_path=None, **settings):
+    """
+    make_hype wired for a boost cycle. Each name in ``trending`` becomes a
+    subscribed instance (with ``limit``) serving its list of statuses; ``client``
+    (a fresh FakeClient by default) is the bot account. State stays in memory
+    unless a tmp_path is given.
+    """
+    hype = make_hype(
+        tmp_path,
+        subscribed_instances=[Instance(name, limit=limit) for name in trending],
+        **settings,
+    )
+    clients = {name: stub_client(statuses) for name, statuses in trending.items()}
+    hype.init_client = lambda name: clients[name]
+    hype.client = client if client is not None else FakeClient()
+    return hype
+
+
+class FakeClient:
+    """Bot account client that records reblogs and searches.
+
+    ``reblog_outcomes`` is consumed one entry per reblog; an exception entry is
+    raised, anything else counts as success. ``search_results`` maps a URI to
+    the statuses ``search_v2`` resolves it to, or to an exception it raises;
+    the ``resolve`` flag of each search is kept in ``search_resolve``.
+    """
+
+    def __init__(self, reblog_outcomes=(), search_results=None, local_timeline=()):
+        self.reblog_outcomes = list(reblog_outcomes)
+        self.search_results = dict(search_results or {})
+        self.local_timeline = list(local_timeline)
+        self.reblogged = []
+        self.searched = []
+        self.search_resolve = []
+        self.timeline_limits = []
+
+    def status_reblog(self, status):
+        self.reblogged.append(status)
+        if self.reblog_outcomes:
+            outcome = self.reblog_outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+
+    def search_v2(self, uri, result_type=None, resolve=None):
+        self.searched.append(uri)
+        self.search_resolve.append(resolve)
+        result = self.search_results.get(uri, [])
+        if isinstance(result, Exception):
+            raise result
+        return {"statuses": list(result)}
+
+    def timeline_local(self, limit=None):
+        self.timeline_limits.append(limit)
+        return list(self.local_timeline)
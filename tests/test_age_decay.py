@@ -1,14 +1,10 @@
-import sys
 import math
 from datetime import datetime, timezone, timedelta
-from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from hype.hype import Hype
-from tests.test_seen_status import DummyConfig, status_data
+from tests.helpers import DummyConfig, status_data
 
 
 def test_age_decay_disabled_by_default(tmp_path):
@@ -158,4 +154,17 @@ def test_age_decay_with_negative_hashtag_scores(tmp_path):
     # penalty = -5 * (1 - 0.5) = -2.5 (negative penalty is actually a bonus)
     # final score = -5 - (-2.5) = -2.5
     expected_score = -5 * 0.5
-    assert score == pytest.approx(expected_score, rel=1e-9)
\ No newline at end of file
+    assert score == pytest.approx(expected_score, rel=1e-9)
+
+
+def test_created_at_is_parsed_once_per_status(tmp_path):
+    """Scoring and ranking reuse the parsed creation time kept on the status."""
+    cfg = DummyConfig(str(tmp_path / "state.json"))
+    hype = Hype(cfg)
+
+    s = status_data("1", "https://a/1")
+    s["created_at"] = "2024-01-01T00:00:00Z"
+    first = hype._created_at(s)
+    assert first == datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert s["_created_at"] is first
+    assert hype._created_at(s) is first
@@ -1,15 +1,11 @@
-import sys
-from pathlib import Path
 import types
 from datetime import datetime
 from unittest.mock import MagicMock
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from hype.hype import Hype
-from tests.test_seen_status import DummyConfig, status_data
+from tests.helpers import DummyConfig, status_data, stub_client
 
 
 def test_normalizes_and_sorts_candidates(tmp_path):
@@ -54,8 +50,7 @@ def test_respects_max_boosts_per_run(tmp_path):
         {"uri": "https://a/1", "reblogs_count": 10, "favourites_count": 10, "created_at": "2024-01-02T00:00:00Z"},
         {"uri": "https://a/2", "reblogs_count": 5, "favourites_count": 5, "created_at": "2024-01-01T00:00:00Z"},
     ]
-    m = MagicMock()
-    m.trending_statuses.return_value = trending
+    m = stub_client(trending)
     hype.init_client = MagicMock(return_value=m)
     client = MagicMock()
     s1 = status_data("1", "https://a/1")
@@ -89,8 +84,7 @@ def test_equal_score_prefers_newer(tmp_path, use_datetime):
     newer["created_at"] = ts("2024-01-02T00:00:00Z")
     
     trending = [older, newer]
-    m = MagicMock()
-    m.trending_statuses.return_value = trending
+    m = stub_client(trending)
     hype.init_client = MagicMock(return_value=m)
     client = MagicMock()
     
@@ -144,8 +138,7 @@ def test_skips_empty_filtered_and_blocked_statuses(tmp_path):
     # s3 is filtered out because it has no media (require_media=True)
     
     trending = [s1, s2, s3]
-    m = MagicMock()
-    m.trending_statuses.return_value = trending
+    m = stub_client(trending)
     hype.init_client = MagicMock(return_value=m)
     client = MagicMock()
     hype.client = client
@@ -168,8 +161,7 @@ def test_stops_when_hour_cap_reached(tmp_path):
         status_data("2", "https://a/2"),
         status_data("3", "https://a/3"),
     ]
-    m = MagicMock()
-    m.trending_statuses.return_value = trending
+    m = stub_client(trending)
     hype.init_client = MagicMock(return_value=m)
     client = MagicMock()
     hype.client = client
@@ -0,0 +1,62 @@
+from unittest.mock import MagicMock, patch
+
+from hype.config import Instance
+from hype.hype import Hype
+from tests.helpers import DummyConfig
+
+
+def test_init_client_reuses_client_per_instance(tmp_path, monkeypatch):
+    """Clients for remote instances are built once and reused across cycles."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "secrets").mkdir()
+    (tmp_path / "secrets" / "a.social_clientcred.secret").write_text("")
+    (tmp_path / "secrets" / "b.social_clientcred.secret").write_text("")
+    cfg = DummyConfig(str(tmp_path / "state.json"))
+    hype = Hype(cfg)
+
+    with patch("hype.hype.Mastodon") as mastodon:
+        mastodon.side_effect = lambda **kwargs: object()
+        first = hype.init_client("a.social")
+        second = hype.init_client("a.social")
+        other = hype.init_client("b.social")
+
+    assert first is second
+    assert other is not first
+    assert mastodon.call_count == 2
+
+
+def test_init_client_rebuilds_expired_client(tmp_path, monkeypatch):
+    """A cached client older than CLIENT_TTL_SECONDS is replaced."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "secrets").mkdir()
+    (tmp_path / "secrets" / "a.social_clientcred.secret").write_text("")
+    cfg = DummyConfig(str(tmp_path / "state.json"))
+    hype = Hype(cfg)
+    hype.CLIENT_TTL_SECONDS = 0
+
+    with patch("hype.hype.Mastodon") as mastodon:
+        mastodon.side_effect = lambda **kwargs: object()
+        first = hype.init_client("a.social")
+        second = hype.init_client("a.social")
+
+    assert first is not second
+    assert mastodon.call_count == 2
+
+
+def test_failed_fetch_invalidates_cached_client(tmp_path, monkeypatch):
+    """A client whose trending fetch raised is rebuilt on the next cycle."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "secrets").mkdir()
+    (tmp_path / "secrets" / "a.social_clientcred.secret").write_text("")
+    cfg = DummyConfig(str(tmp_path / "state.json"))
+    hype = Hype(cfg)
+
+    with patch("hype.hype.Mastodon") as mastodon:
+        mastodon.side_effect = lambda **kwargs: MagicMock()
+        first = hype.init_client("a.social")
+        first.trending_statuses.side_effect = RuntimeError("boom")
+        assert hype._fetch_trending_statuses(Instance("a.social", limit=5)) == []
+        second = hype.init_client("a.social")
+
+    assert second is not first
+    assert mastodon.call_count == 2
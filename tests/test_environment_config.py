@@ -1,296 +1,175 @@
+import logging
 import os
-import sys
-import tempfile
-import yaml
-from pathlib import Path
-from unittest.mock import patch, mock_open
+from io import BytesIO
+from unittest.mock import patch
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from hype.config import Config
 
-from hype.config import Config, ConfigException
-
-
-def test_environment_variable_override_simple():
-    """Test that environment variables override defaults using mocking."""
-    
-    # Mock file system calls
-    auth_content = """
+_AUTH_YAML = b"""
 bot_account:
   server: "https://test.example"
   access_token: "test_token"
 """
-    
-    config_content = """
-interval: 60
-subscribed_instances:
-  test.instance:
-    limit: 5
-"""
-    
-    # Mock the file operations
-    mock_files = {
-        "/app/config/auth.yaml": auth_content,
-        "/app/config/config.yaml": config_content
-    }
-    
-    def mock_open_func(filename, mode='r'):
-        if filename in mock_files:
-            from io import StringIO
-            return StringIO(mock_files[filename])
-        else:
-            raise FileNotFoundError(f"No such file: {filename}")
-    
-    with patch('builtins.open', side_effect=mock_open_func):
-        with patch.dict(os.environ, {'HYPE_MIN_REPLIES': '5', 'HYPE_INTERVAL': '120'}):
-            config = Config()
-            assert config.min_replies == 5
-            assert config.interval == 120
+_CONFIG_PATH = "/app/config/config.yaml"
 
 
-def test_config_file_values_without_environment():
-    """Test that config file values are used when no environment variables are set."""
-    
-    auth_content = """
-bot_account:
-  server: "https://test.example"
-  access_token: "test_token"
-"""
-    
-    config_content = """
-interval: 90
-min_replies: 3
-daily_public_cap: 30
-"""
-    
-    mock_files = {
-        "/app/config/auth.yaml": auth_content,
-        "/app/config/config.yaml": config_content
-    }
-    
+@pytest.fixture
+def mock_config_files():
+    """Patch open() to serve auth.yaml plus a per-test config.yaml from memory."""
+    files = {"/app/config/auth.yaml": _AUTH_YAML, _CONFIG_PATH: b""}
+
     def mock_open_func(filename, mode='r'):
-        if filename in mock_files:
-            from io import StringIO
-            return StringIO(mock_files[filename])
-        else:
-            raise FileNotFoundError(f"No such file: {filename}")
-    
+        if filename in files:
+            return BytesIO(files[filename])
+        raise FileNotFoundError(f"No such file: {filename}")
+
     with patch('builtins.open', side_effect=mock_open_func):
-        # Clear any existing environment variables
-        env_vars_to_clear = ['HYPE_MIN_REPLIES', 'HYPE_INTERVAL', 'HYPE_DAILY_PUBLIC_CAP']
-        env_patch = {var: None for var in env_vars_to_clear if var in os.environ}
-        
-        with patch.dict(os.environ, env_patch, clear=False):
+        yield files
+
+
+@pytest.mark.parametrize(
+    "env,config_content,expected",
+    [
+        pytest.param(
+            {"HYPE_MIN_REPLIES": "5", "HYPE_INTERVAL": "120"},
+            b"interval: 60\nsubscribed_instances:\n  test.instance:\n    limit: 5\n",
+            {"min_replies": 5, "interval": 120},
+            id="env-overrides-file",
+        ),
+        pytest.param(
+            {},
+            b"interval: 90\nmin_replies: 3\ndaily_public_cap: 30\n",
+            {"interval": 90, "min_replies": 3, "daily_public_cap": 30},
+            id="file-without-env",
+        ),
+        pytest.param(
+            {"HYPE_MIN_REPLIES": "invalid_number"},
+            b"min_replies: 2\ninterval: 60\n",
+            {"min_replies": 2},
+            id="invalid-env-falls-back-to-file",
+        ),
+        pytest.param(
+            {"HYPE_REQUIRE_MEDIA": "false", "HYPE_DEBUG_DECISIONS": "0"},
+            b"require_media: true\ndebug_decisions: false\n",
+            {"require_media": False, "debug_decisions": False},
+            id="boolean-env",
+        ),
+    ],
+)
+def test_scalar_setting_precedence(mock_config_files, env, config_content, expected):
+    """Scalar settings resolve as environment variable, then config file, then default."""
+    mock_config_files[_CONFIG_PATH] = config_content
+
+    with patch.dict(os.environ, env, clear=True):
+        config = Config()
+    for key, value in expected.items():
+        assert getattr(config, key) == value
+
+
+def test_unknown_hype_variable_is_reported(mock_config_files, caplog):
+    """Misspelled HYPE_* variables are logged instead of silently ignored."""
+    with patch.dict(os.environ, {"HYPE_MIN_REPLYS": "5"}, clear=True):
+        with caplog.at_level(logging.WARNING, logger="Config"):
             config = Config()
-            assert config.interval == 90
-            assert config.min_replies == 3
-            assert config.daily_public_cap == 30
+    assert config.min_replies == 2
+    assert "HYPE_MIN_REPLYS" in caplog.text
 
 
-def test_default_values_when_no_config():
+def test_default_values_when_no_config(mock_config_files):
     """Test that defaults are used when neither env vars nor config file values are set."""
     
-    auth_content = """
-bot_account:
-  server: "https://test.example"
-  access_token: "test_token"
-"""
-    
-    config_content = """
+    config_content = b"""
 subscribed_instances:
   test.instance:
     limit: 5
 """
     
-    mock_files = {
-        "/app/config/auth.yaml": auth_content,
-        "/app/config/config.yaml": config_content
-    }
-    
-    def mock_open_func(filename, mode='r'):
-        if filename in mock_files:
-            from io import StringIO
-            return StringIO(mock_files[filename])
-        else:
-            raise FileNotFoundError(f"No such file: {filename}")
-    
-    with patch('builtins.open', side_effect=mock_open_func):
-        with patch.dict(os.environ, {}, clear=True):
-            config = Config()
-            # Should use default values (updated to production defaults)
-            assert config.min_replies == 2
-            assert config.interval == 15
-            assert config.daily_public_cap == 96
-            assert config.per_hour_public_cap == 5
-            assert config.log_level == "DEBUG"
-            assert config.debug_decisions == True
-            assert config.require_media == False
-            assert config.min_reblogs == 10
-            assert config.min_favourites == 10
-            assert config.languages_allowlist == ["en"]
-            assert config.filtered_instances == ["example.com"]
-            assert "goingdark.social" in config.profile_prefix
-            assert config.fields["instance"] == "https://goingdark.social"
-            assert config.hashtag_scores["homelab"] == 20
-            assert config.hashtag_scores["kubernetes"] == 15
-
-
-def test_invalid_environment_variable_fallback():
-    """Test that invalid environment variable values fall back gracefully."""
-    
-    auth_content = """
-bot_account:
-  server: "https://test.example"
-  access_token: "test_token"
-"""
-    
-    config_content = """
-min_replies: 2
-interval: 60
-"""
-    
-    mock_files = {
-        "/app/config/auth.yaml": auth_content,
-        "/app/config/config.yaml": config_content
-    }
-    
-    def mock_open_func(filename, mode='r'):
-        if filename in mock_files:
-            from io import StringIO
-            return StringIO(mock_files[filename])
-        else:
-            raise FileNotFoundError(f"No such file: {filename}")
-    
-    with patch('builtins.open', side_effect=mock_open_func):
-        with patch.dict(os.environ, {'HYPE_MIN_REPLIES': 'invalid_number'}):
-            config = Config()
-            # Should fall back to config file value when env var is invalid
-            assert config.min_replies == 2
-
-
-def test_boolean_environment_variables():
-    """Test that boolean environment variables are properly parsed."""
-    
-    auth_content = """
-bot_account:
-  server: "https://test.example"
-  access_token: "test_token"
-"""
-    
-    config_content = """
-require_media: true
-debug_decisions: false
-"""
-    
-    mock_files = {
-        "/app/config/auth.yaml": auth_content,
-        "/app/config/config.yaml": config_content
-    }
-    
-    def mock_open_func(filename, mode='r'):
-        if filename in mock_files:
-            from io import StringIO
-            return StringIO(mock_files[filename])
-        else:
-            raise FileNotFoundError(f"No such file: {filename}")
-    
-    with patch('builtins.open', side_effect=mock_open_func):
-        with patch.dict(os.environ, {
-            'HYPE_REQUIRE_MEDIA': 'false',
-            'HYPE_DEBUG_DECISIONS': '0'
-        }):
-            config = Config()
-            assert config.require_media == False
-            assert config.debug_decisions == False
-
-
-def test_default_subscribed_instances():
+    mock_config_files[_CONFIG_PATH] = config_content
+    
+    with patch.dict(os.environ, {}, clear=True):
+        config = Config()
+        # Should use default values (updated to production defaults)
+        assert config.min_replies == 2
+        assert config.interval == 15
+        assert config.daily_public_cap == 96
+        assert config.per_hour_public_cap == 5
+        assert config.log_level == "DEBUG"
+        assert config.debug_decisions == True
+        assert config.require_media == False
+        assert config.min_reblogs == 10
+        assert config.min_favourites == 10
+        assert config.languages_allowlist == ["en"]
+        assert config.filtered_instances == ["example.com"]
+        assert "goingdark.social" in config.profile_prefix
+        assert config.fields["instance"] == "https://goingdark.social"
+        assert config.hashtag_scores["homelab"] == 20
+        assert config.hashtag_scores["kubernetes"] == 15
+
+
+def test_default_subscribed_instances(mock_config_files):
     """Test that default subscribed instances are used when none are configured."""
     
-    auth_content = """
-bot_account:
-  server: "https://test.example"
-  access_token: "test_token"
-"""
-    
     # Config file with no subscribed_instances
-    config_content = """
+    config_content = b"""
 interval: 15
 """
     
-    mock_files = {
-        "/app/config/auth.yaml": auth_content,
-        "/app/config/config.yaml": config_content
-    }
-    
-    def mock_open_func(filename, mode='r'):
-        if filename in mock_files:
-            from io import StringIO
-            return StringIO(mock_files[filename])
-        else:
-            raise FileNotFoundError(f"No such file: {filename}")
+    mock_config_files[_CONFIG_PATH] = config_content
     
-    with patch('builtins.open', side_effect=mock_open_func):
-        with patch.dict(os.environ, {}, clear=True):
-            config = Config()
-            # Should use default goingdark.social instances
-            assert len(config.subscribed_instances) == 7
-            
-            # Check for expected instances
-            instance_names = [inst.name for inst in config.subscribed_instances]
-            assert "infosec.exchange" in instance_names
-            assert "mastodon.social" in instance_names
-            assert "mas.to" in instance_names
-            assert "fosstodon.org" in instance_names
-            assert "floss.social" in instance_names
-            assert "ioc.exchange" in instance_names
-            assert "mstdn.social" in instance_names
-            
-            # Check that all instances have fetch_limit=20 and varying boost_limits
-            for inst in config.subscribed_instances:
-                assert inst.fetch_limit == 20
-                assert inst.boost_limit > 0
-            
-            # Check specific boost limits
-            infosec = next((i for i in config.subscribed_instances if i.name == "infosec.exchange"), None)
-            assert infosec is not None
-            assert infosec.boost_limit == 5
+    with patch.dict(os.environ, {}, clear=True):
+        config = Config()
+        # Should use default goingdark.social instances
+        assert len(config.subscribed_instances) == 7
+        
+        # Check for expected instances
+        instance_names = [inst.name for inst in config.subscribed_instances]
+        assert "infosec.exchange" in instance_names
+        assert "mastodon.social" in instance_names
+        assert "mas.to" in instance_names
+        assert "fosstodon.org" in instance_names
+        assert "floss.social" in instance_names
+        assert "ioc.exchange" in instance_names
+        assert "mstdn.social" in instance_names
+        
+        # Check that all instances have fetch_limit=20 and varying boost_limits
+        for inst in config.subscribed_instances:
+            assert inst.fetch_limit == 20
+            assert inst.boost_limit > 0
+        
+        # Check specific boost limits
+        infosec = next((i for i in config.subscribed_instances if i.name == "infosec.exchange"), None)
+        assert infosec is not None
+        assert infosec.boost_limit == 5
+
 
+def test_default_instances_are_not_shared_between_configs(mock_config_files):
+    """Each Config gets its own default Instance objects."""
+    with patch.dict(os.environ, {}, clear=True):
+        first = Config()
+        second = Config()
+    first.subscribed_instances[0].boost_limit = 99
+    assert second.subscribed_instances[0].boost_limit == 5
 
-def test_config_file_instances_override_defaults():
+
+def test_config_file_instances_override_defaults(mock_config_files):
     """Test that config file instances override the defaults."""
     
-    auth_content = """
-bot_account:
-  server: "https://test.example"
-  access_token: "test_token"
-"""
-    
-    config_content = """
+    config_content = b"""
 subscribed_instances:
   custom.instance:
     fetch_limit: 10
     boost_limit: 3
 """
     
-    mock_files = {
-        "/app/config/auth.yaml": auth_content,
-        "/app/config/config.yaml": config_content
-    }
+    mock_config_files[_CONFIG_PATH] = config_content
     
-    def mock_open_func(filename, mode='r'):
-        if filename in mock_files:
-            from io import StringIO
-            return StringIO(mock_files[filename])
-        else:
-            raise FileNotFoundError(f"No such file: {filename}")
-    
-    with patch('builtins.open', side_effect=mock_open_func):
-        with patch.dict(os.environ, {}, clear=True):
-            config = Config()
-            # Should use config file instances, not defaults
-            assert len(config.subscribed_instances) == 1
-            assert config.subscribed_instances[0].name == "custom.instance"
-            assert config.subscribed_instances[0].fetch_limit == 10
-            assert config.subscribed_instances[0].boost_limit == 3
\ No newline at end of file
+    with patch.dict(os.environ, {}, clear=True):
+        config = Config()
+        # Should use config file instances, not defaults
+        assert len(config.subscribed_instances) == 1
+        assert config.subscribed_instances[0].name == "custom.instance"
+        assert config.subscribed_instances[0].fetch_limit == 10
+        assert config.subscribed_instances[0].boost_limit == 3
+
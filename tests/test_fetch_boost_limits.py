@@ -1,15 +1,10 @@
-import sys
+import threading
 import types
-from pathlib import Path
 from unittest.mock import MagicMock
 
-import pytest
-
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from hype.hype import Hype
 from hype.config import Instance
-from tests.test_seen_status import DummyConfig, status_data
+from tests.helpers import DummyConfig, FakeClient, status_data, stub_client
 
 
 def test_fetch_limit_requests_from_api(tmp_path):
@@ -48,8 +43,7 @@ def test_boost_limit_restricts_per_instance(tmp_path):
         for i in range(1, 6)
     ]
     
-    m = MagicMock()
-    m.trending_statuses.return_value = trending
+    m = stub_client(trending)
     hype.init_client = MagicMock(return_value=m)
     hype.client = MagicMock()
     
@@ -74,8 +68,7 @@ def test_legacy_limit_works_as_before(tmp_path):
         for i in range(1, 6)
     ]
     
-    m = MagicMock()
-    m.trending_statuses.return_value = trending
+    m = stub_client(trending)
     hype.init_client = MagicMock(return_value=m)
     hype.client = MagicMock()
     
@@ -100,18 +93,15 @@ def test_multiple_instances_respect_individual_limits(tmp_path):
     trending_i1 = [status_data(f"1{i}", f"https://i1/{i}") for i in range(1, 6)]
     trending_i2 = [status_data(f"2{i}", f"https://i2/{i}") for i in range(1, 6)]
     
-    m1 = MagicMock()
-    m1.trending_statuses.return_value = trending_i1
-    m2 = MagicMock()
-    m2.trending_statuses.return_value = trending_i2
-    
-    hype.init_client = MagicMock(side_effect=[m1, m2])
-    hype.client = MagicMock()
+    clients = {"i1": stub_client(trending_i1), "i2": stub_client(trending_i2)}
+    hype.init_client = lambda name: clients[name]
+    hype.client = FakeClient()
     
     hype.boost()
     
     # Should boost 2 from i1 + 3 from i2 = 5 total
-    assert hype.client.status_reblog.call_count == 5
+    reblogged = [s["uri"].split("/")[2] for s in hype.client.reblogged]
+    assert sorted(reblogged) == ["i1", "i1", "i2", "i2", "i2"]
 
 
 def test_instance_defaults_fetch_20_boost_4(tmp_path):
@@ -143,6 +133,10 @@ def test_instance_respects_api_maximum(tmp_path):
     # boost_limit can be anything
     assert inst.boost_limit == 10
 
+    # Legacy single limit is capped for both fetch and boost
+    legacy = Instance(name="test.instance", limit=50)
+    assert (legacy.fetch_limit, legacy.boost_limit) == (20, 20)
+
 
 def test_backward_compatibility_with_simplenamespacee(tmp_path):
     """Test that SimpleNamespace instances (used in tests) still work."""
@@ -159,8 +153,7 @@ def test_backward_compatibility_with_simplenamespacee(tmp_path):
         for i in range(1, 4)
     ]
     
-    m = MagicMock()
-    m.trending_statuses.return_value = trending
+    m = stub_client(trending)
     hype.init_client = MagicMock(return_value=m)
     hype.client = MagicMock()
     
@@ -168,3 +161,73 @@ def test_backward_compatibility_with_simplenamespacee(tmp_path):
     
     # Should boost 2 (the limit)
     assert hype.client.status_reblog.call_count == 2
+
+
+def test_instances_are_fetched_concurrently(tmp_path):
+    """Trending fetches for different instances overlap instead of running serially."""
+    cfg = DummyConfig(str(tmp_path / "state.json"))
+    inst1 = Instance(name="i1", fetch_limit=10, boost_limit=2)
+    inst2 = Instance(name="i2", fetch_limit=10, boost_limit=2)
+    cfg.subscribed_instances = [inst1, inst2]
+    cfg.local_timeline_enabled = False
+
+    hype = Hype(cfg)
+
+    # Each fetch waits for the other one, which only succeeds if both run at once
+    barrier = threading.Barrier(2, timeout=5)
+
+    def trending_for(prefix):
+        def trending_statuses(limit=None):
+            barrier.wait()
+            return [status_data(f"{prefix}1", f"https://{prefix}/1")]
+        return trending_statuses
+
+    clients = {}
+    for name in ("i1", "i2"):
+        clients[name] = MagicMock()
+        clients[name].trending_statuses.side_effect = trending_for(name)
+    hype.init_client = lambda name: clients[name]
+    hype.client = MagicMock()
+
+    hype.boost()
+
+    assert hype.client.status_reblog.call_count == 2
+
+
+def test_instance_listed_twice_is_fetched_once(tmp_path):
+    """Duplicate subscriptions share one trending fetch and the first entry's limits."""
+    cfg = DummyConfig(str(tmp_path / "state.json"))
+    cfg.subscribed_instances = [
+        Instance(name="i1", fetch_limit=10, boost_limit=1),
+        Instance(name="i1", fetch_limit=10, boost_limit=5),
+    ]
+    cfg.local_timeline_enabled = False
+
+    hype = Hype(cfg)
+    remote = MagicMock()
+    remote.trending_statuses.return_value = [status_data(f"{i}", f"https://a/{i}") for i in range(1, 4)]
+    hype.init_client = MagicMock(return_value=remote)
+    hype.client = MagicMock()
+
+    hype.boost()
+
+    assert remote.trending_statuses.call_count == 1
+    assert hype.client.status_reblog.call_count == 1
+
+
+def test_boost_loop_stops_once_every_instance_limit_is_spent(tmp_path):
+    """Candidates left after all per-instance budgets are used are not evaluated."""
+    cfg = DummyConfig(str(tmp_path / "state.json"))
+    cfg.subscribed_instances = [Instance(name="i1", fetch_limit=10, boost_limit=1)]
+    cfg.local_timeline_enabled = False
+
+    hype = Hype(cfg)
+    trending = [status_data(f"{i}", f"https://a/{i}") for i in range(1, 6)]
+    hype.init_client = MagicMock(return_value=stub_client(trending))
+    hype.client = MagicMock()
+    hype._seen_status = MagicMock(wraps=hype._seen_status)
+
+    hype.boost()
+
+    assert hype.client.status_reblog.call_count == 1
+    assert hype._seen_status.call_count == 1
@@ -1,12 +1,8 @@
-import sys
 import types
-from pathlib import Path
 from unittest.mock import MagicMock
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from hype.hype import Hype
-from tests.test_seen_status import DummyConfig, status_data
+from tests.helpers import DummyConfig, status_data
 
 
 def test_hashtag_diversity_disabled_by_default(tmp_path):
@@ -225,4 +221,20 @@ def test_hashtag_diversity_with_no_hashtags(tmp_path):
     # Both should be fine since no hashtags to conflict
     assert not hype._hashtag_diversity_hit(s1)
     hype._remember_status(s1)
-    assert not hype._hashtag_diversity_hit(s2)
\ No newline at end of file
+    assert not hype._hashtag_diversity_hit(s2)
+
+def test_repeated_tag_in_one_post_counts_once(tmp_path):
+    """A post listing the same hashtag twice (in any case) uses one slot."""
+    cfg = DummyConfig(str(tmp_path / "state.json"))
+    cfg.hashtag_diversity_enforced = True
+    cfg.max_boosts_per_hashtag_per_run = 2
+    hype = Hype(cfg)
+
+    s1 = status_data("1", "https://a/1")
+    s1["tags"] = [{"name": "Python"}, {"name": "python"}]
+    s2 = status_data("2", "https://a/2")
+    s2["tags"] = [{"name": "PYTHON"}]
+
+    hype._remember_status(s1)
+    assert s1["_tag_lc"] == frozenset({"python"})
+    assert not hype._hashtag_diversity_hit(s2)
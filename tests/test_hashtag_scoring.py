@@ -1,21 +1,17 @@
-import sys
-import types
-from pathlib import Path
 from unittest.mock import MagicMock
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
+from hype.config import Instance
 from hype.hype import Hype
-from tests.test_seen_status import DummyConfig, status_data
+from tests.helpers import DummyConfig, FakeClient, status_data
 
 
 def test_prioritizes_weighted_hashtags(tmp_path):
     cfg = DummyConfig(str(tmp_path / "state.json"))
     cfg.hashtag_scores = {"python": 10}
-    inst = types.SimpleNamespace(name="i", limit=2)
+    inst = Instance("i", limit=2)
     cfg.subscribed_instances = [inst]
     hype = Hype(cfg)
-    hype.client = MagicMock()
+    hype.client = FakeClient()
     m = MagicMock()
     
     # Trending returns full status objects
@@ -30,5 +26,31 @@ def test_prioritizes_weighted_hashtags(tmp_path):
     hype.boost()
     
     # Verify s1 (python) was boosted first
-    first_reblog = hype.client.status_reblog.call_args_list[0][0][0]
+    first_reblog = hype.client.reblogged[0]
     assert first_reblog["uri"] == "https://a/1"
+
+
+def test_hashtag_weights_ignore_case_and_repeats(tmp_path):
+    cfg = DummyConfig(str(tmp_path / "state.json"))
+    cfg.hashtag_scores = {"Python": 10}
+    hype = Hype(cfg)
+
+    plain = status_data("1", "https://a/1")
+    plain["tags"] = [{"name": "python"}]
+    repeated = status_data("2", "https://a/2")
+    repeated["tags"] = [{"name": "PYTHON"}, {"name": "python"}]
+
+    assert hype.score_status(plain) == hype.score_status(repeated)
+    assert hype.score_status(plain) > hype.score_status(status_data("3", "https://a/3"))
+
+
+def test_hashtag_weight_keys_may_include_hash_sign(tmp_path):
+    cfg = DummyConfig(str(tmp_path / "state.json"))
+    cfg.hashtag_scores = {"#HomeLab": 10}
+    hype = Hype(cfg)
+
+    tagged = status_data("1", "https://a/1")
+    tagged["tags"] = [{"name": "homelab"}, {"name": "unweighted"}]
+    untagged = status_data("2", "https://a/2")
+
+    assert hype.score_status(tagged) == hype.score_status(untagged) + 10
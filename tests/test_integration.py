@@ -1,16 +1,10 @@
-import sys
-import types
-from pathlib import Path
 from unittest.mock import MagicMock
 
 from mastodon.errors import MastodonNotFoundError
 
-import pytest
-
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
+from hype.config import Instance
 from hype.hype import Hype
-from tests.test_seen_status import DummyConfig, status_data
+from tests.helpers import DummyConfig, FakeClient, status_data, stub_client
 
 
 def test_complete_quality_and_related_hashtag_integration(tmp_path):
@@ -34,7 +28,7 @@ def test_complete_quality_and_related_hashtag_integration(tmp_path):
         }
     }
     
-    inst = types.SimpleNamespace(name="test_instance", limit=5)
+    inst = Instance("test_instance", limit=5)
     cfg.subscribed_instances = [inst]
     
     hype = Hype(cfg)
@@ -102,38 +96,29 @@ def test_complete_quality_and_related_hashtag_integration(tmp_path):
         },
     ]
     
-    m = MagicMock()
-    m.trending_statuses.return_value = trending
-    hype.init_client = MagicMock(return_value=m)
-    
-    client = MagicMock()
-    client.status_reblog.side_effect = [
-        MastodonNotFoundError("Not found"), None,
-        MastodonNotFoundError("Not found"), None,
-        MastodonNotFoundError("Not found"), None,
-    ]
-
-    def search_side_effect(uri, result_type=None, resolve=None):
-        responses = {
-            "https://example.com/1": {"statuses": [{**status_data("1", "https://example.com/1"), "replies_count": 2}]},
-            "https://example.com/2": {"statuses": [{**status_data("2", "https://example.com/2"), "replies_count": 2}]},
-            "https://example.com/4": {"statuses": [{**status_data("4", "https://example.com/4"), "replies_count": 2}]},
-        }
-        return responses.get(uri, {"statuses": []})
-
-    client.search_v2.side_effect = search_side_effect
+    hype.init_client = MagicMock(return_value=stub_client(trending))
+    
+    client = FakeClient(
+        reblog_outcomes=[
+            MastodonNotFoundError("Not found"), None,
+            MastodonNotFoundError("Not found"), None,
+            MastodonNotFoundError("Not found"), None,
+        ],
+        search_results={
+            uri: [{**status_data(i, uri), "replies_count": 2}]
+            for i, uri in (("1", "https://example.com/1"), ("2", "https://example.com/2"), ("4", "https://example.com/4"))
+        },
+    )
     hype.client = client
     
     hype.boost()
     
     # Verify only the qualifying posts were boosted
-    assert client.status_reblog.call_count == 6
-    assert client.search_v2.call_count == 3
+    assert len(client.reblogged) == 6
     
     # Verify the search calls were for the expected URIs (in score-sorted order)
-    search_calls = [call[0][0] for call in client.search_v2.call_args_list]
     expected_uris = ["https://example.com/1", "https://example.com/4", "https://example.com/2"]  # Sorted by score
-    assert search_calls == expected_uris
+    assert client.searched == expected_uris
 
 
 def test_quality_threshold_with_all_posts_failing(tmp_path):
@@ -147,7 +132,7 @@ def test_quality_threshold_with_all_posts_failing(tmp_path):
         }
     }
     
-    inst = types.SimpleNamespace(name="test_instance", limit=3)
+    inst = Instance("test_instance", limit=3)
     cfg.subscribed_instances = [inst]
     
     hype = Hype(cfg)
@@ -172,21 +157,16 @@ def test_quality_threshold_with_all_posts_failing(tmp_path):
         },
     ]
     
-    m = MagicMock()
-    m.trending_statuses.return_value = trending
-    hype.init_client = MagicMock(return_value=m)
+    hype.init_client = MagicMock(return_value=stub_client(trending))
     
-    client = MagicMock()
-    client.status_reblog.side_effect = [
-        MastodonNotFoundError("Not found"), None
-    ]
+    client = FakeClient()
     hype.client = client
     
     hype.boost()
     
     # No posts should be boosted since all fail threshold
-    assert client.status_reblog.call_count == 0
-    assert client.search_v2.call_count == 0
+    assert client.reblogged == []
+    assert client.searched == []
 
 
 def test_related_hashtag_scoring_affects_quality_threshold(tmp_path):
@@ -201,7 +181,7 @@ def test_related_hashtag_scoring_affects_quality_threshold(tmp_path):
     }
     cfg.min_replies = 2
     
-    inst = types.SimpleNamespace(name="test_instance", limit=2)
+    inst = Instance("test_instance", limit=2)
     cfg.subscribed_instances = [inst]
     
     hype = Hype(cfg)
@@ -231,27 +211,41 @@ def test_related_hashtag_scoring_affects_quality_threshold(tmp_path):
         },
     ]
     
-    m = MagicMock()
-    m.trending_statuses.return_value = trending
-    hype.init_client = MagicMock(return_value=m)
+    hype.init_client = MagicMock(return_value=stub_client(trending))
     
-    client = MagicMock()
-    def single_search_side_effect(uri, result_type=None, resolve=None):
-        if uri == "https://example.com/1":
-            return {"statuses": [{**status_data("1", "https://example.com/1"), "replies_count": 2}]}
-        return {"statuses": []}
-
-    client.search_v2.side_effect = single_search_side_effect
-    client.status_reblog.side_effect = [
-        MastodonNotFoundError("Not found"), None
-    ]
-    client.status_reblog.side_effect = [
-        MastodonNotFoundError("Not found"), None
-    ]
+    client = FakeClient(
+        reblog_outcomes=[MastodonNotFoundError("Not found"), None],
+        search_results={
+            "https://example.com/1": [{**status_data("1", "https://example.com/1"), "replies_count": 2}],
+        },
+    )
     hype.client = client
     
     hype.boost()
     
     # Only the first post should pass thanks to the related hashtag bonus
-    assert client.status_reblog.call_count == 2
-    assert client.search_v2.call_count == 1
+    assert len(client.reblogged) == 2
+    assert client.searched == ["https://example.com/1"]
+
+
+def test_posts_that_cannot_reach_threshold_are_not_scored(tmp_path):
+    """Engagement plus the best possible content score below the threshold skips scoring."""
+    cfg = DummyConfig(str(tmp_path / "state.json"))
+    cfg.min_score_threshold = 10
+    cfg.hashtag_scores = {"test": 5.0}
+    cfg.related_hashtags = {"test": {"example": 0.5}}
+    cfg.local_timeline_enabled = False
+    cfg.subscribed_instances = [Instance("test_instance", limit=3)]
+
+    hype = Hype(cfg)
+    # Ceiling is 5.0 + 2.5; only the second post has enough engagement to make up the rest
+    low = {**status_data("1", "https://example.com/1"), "reblogs_count": 1, "favourites_count": 1}
+    high = {**status_data("2", "https://example.com/2"), "reblogs_count": 20, "favourites_count": 20}
+    hype.init_client = MagicMock(return_value=stub_client([low, high]))
+    hype.client = FakeClient()
+    hype.score_status = MagicMock(return_value=0.0)
+
+    hype.boost()
+
+    scored = [c.args[0]["id"] for c in hype.score_status.call_args_list]
+    assert scored == ["2"]
@@ -1,11 +1,7 @@
-import sys
-from pathlib import Path
-import pytest
-
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from unittest.mock import patch
 
 from hype.hype import Hype
-from tests.test_seen_status import DummyConfig, status_data
+from tests.helpers import DummyConfig, status_data
 
 
 def test_language_detection_fallback_for_english(tmp_path):
@@ -242,3 +238,77 @@ def test_use_mastodon_language_detection_disabled_correct_english(tmp_path):
     
     # Should NOT skip because we detect it's English (override Mastodon's "fr")
     assert hype._should_skip_status(s) is False
+
+
+def test_language_detection_is_cached_per_content(tmp_path):
+    """The same post body is only run through langdetect once."""
+    hype = Hype(DummyConfig(str(tmp_path / "state.json")))
+    s = status_data("1", "https://a/1")
+    s["content"] = "<p>This is clearly an English sentence about servers.</p>"
+
+    with patch("hype.hype.detect", return_value="EN") as detect:
+        assert hype._detect_language_from_content(s) == "en"
+        assert hype._detect_language_from_content(dict(s, id="2")) == "en"
+    assert detect.call_count == 1
+
+
+def test_language_detection_keeps_words_apart_across_tags(tmp_path):
+    """Stripped markup leaves a single space between the words it separated."""
+    hype = Hype(DummyConfig(str(tmp_path / "state.json")))
+    s = status_data("1", "https://a/1")
+    s["content"] = "<p>Hello</p><p>world,</p>\n\n<p>see @someone and #tag here</p>"
+
+    with patch("hype.hype.detect", return_value="en") as detect:
+        hype._detect_language_from_content(s)
+    detect.assert_called_once_with("Hello world, see and here")
+
+
+def test_language_cache_is_bounded(tmp_path):
+    """The oldest cached detection is evicted once the cache is full."""
+    hype = Hype(DummyConfig(str(tmp_path / "state.json")))
+    hype.LANGUAGE_CACHE_SIZE = 1
+    first = dict(status_data("1", "https://a/1"), content="<p>The first English post body.</p>")
+    second = dict(status_data("2", "https://a/2"), content="<p>The second English post body.</p>")
+
+    with patch("hype.hype.detect", return_value="en") as detect:
+        hype._detect_language_from_content(first)
+        hype._detect_language_from_content(second)
+        hype._detect_language_from_content(first)
+    assert detect.call_count == 3
+    assert len(hype._lang_cache) == 1
+
+
+def test_language_cache_is_per_instance(tmp_path):
+    """A new Hype doesn't reuse detections cached by another one."""
+    s = dict(status_data("1", "https://a/1"), content="<p>This is clearly an English sentence.</p>")
+
+    with patch("hype.hype.detect", return_value="en") as detect:
+        Hype(DummyConfig(str(tmp_path / "state.json")))._detect_language_from_content(s)
+        Hype(DummyConfig(str(tmp_path / "state.json")))._detect_language_from_content(s)
+    assert detect.call_count == 2
+
+
+def test_language_detection_handles_unclosed_brackets(tmp_path):
+    """Runs of '<' without a closing '>' are left as text, not treated as a tag."""
+    hype = Hype(DummyConfig(str(tmp_path / "state.json")))
+    s = status_data("1", "https://a/1")
+    s["content"] = "<p>" + "<" * 20000 + " plain words</p>"
+
+    with patch("hype.hype.detect", return_value="en") as detect:
+        hype._detect_language_from_content(s)
+    assert detect.call_args.args[0] == "<" * 20000 + " plain words"
+
+
+def test_language_not_detected_when_cheaper_checks_fail(tmp_path):
+    """Statuses already failing the engagement minimums skip language detection."""
+    cfg = DummyConfig(str(tmp_path / "state.json"))
+    cfg.languages_allowlist = ["en"]
+    cfg.min_reblogs = 5
+    cfg.debug_decisions = False  # debug mode walks every check to log it
+    hype = Hype(cfg)
+    s = status_data("1", "https://a/1")
+    s["content"] = "<p>This is clearly an English sentence about servers.</p>"
+
+    with patch("hype.hype.detect", return_value="en") as detect:
+        assert hype._should_skip_status(s)
+    detect.assert_not_called()
@@ -1,92 +1,87 @@
-import sys
-from pathlib import Path
+import threading
 import types
 from datetime import datetime, timezone, timedelta
 from unittest.mock import MagicMock
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from tests.helpers import FakeClient, make_hype, status_data, stub_client
 
-from hype.hype import Hype
-from tests.test_seen_status import DummyConfig
+
+def iso_z(dt):
+    """Mastodon-style created_at: UTC, millisecond precision, trailing Z."""
+    return dt.astimezone(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
 
 
 def test_local_timeline_enabled_by_default(tmp_path):
     """Test that local timeline is enabled by default"""
-    cfg = DummyConfig(str(tmp_path / "state.json"))
     inst = types.SimpleNamespace(name="remote.social", fetch_limit=20, boost_limit=2)
-    cfg.subscribed_instances = [inst]
-    hype = Hype(cfg)
+    hype = make_hype(tmp_path, subscribed_instances=[inst])
     
-    # Mock remote instance
-    remote_mock = MagicMock()
-    remote_mock.trending_statuses.return_value = []
-    hype.init_client = MagicMock(return_value=remote_mock)
+    # Remote instance
+    hype.init_client = MagicMock(return_value=stub_client())
     
-    # Mock bot client
-    bot_client = MagicMock()
-    bot_client.timeline_local = MagicMock(return_value=[])
+    # Bot client
+    bot_client = FakeClient()
     hype.client = bot_client
     
     hype.boost()
     
     # timeline_local should be called when enabled (default)
-    assert bot_client.timeline_local.call_count == 1
+    assert bot_client.timeline_limits == [20]
 
 
 def test_local_timeline_can_be_disabled(tmp_path):
     """Test that local timeline can be explicitly disabled"""
-    cfg = DummyConfig(str(tmp_path / "state.json"))
-    cfg.local_timeline_enabled = False  # Explicitly disable
     inst = types.SimpleNamespace(name="remote.social", fetch_limit=20, boost_limit=2)
-    cfg.subscribed_instances = [inst]
-    hype = Hype(cfg)
+    hype = make_hype(
+        tmp_path,
+        local_timeline_enabled=False,  # Explicitly disable
+        subscribed_instances=[inst],
+    )
     
-    # Mock remote instance
-    remote_mock = MagicMock()
-    remote_mock.trending_statuses.return_value = []
-    hype.init_client = MagicMock(return_value=remote_mock)
+    # Remote instance
+    hype.init_client = MagicMock(return_value=stub_client())
     
-    # Mock bot client
-    bot_client = MagicMock()
-    bot_client.timeline_local = MagicMock(return_value=[])
+    # Bot client
+    bot_client = FakeClient()
     hype.client = bot_client
     
     hype.boost()
     
     # timeline_local should not be called when disabled
-    assert bot_client.timeline_local.call_count == 0
+    assert bot_client.timeline_limits == []
 
 
 def test_local_timeline_fetches_when_enabled(tmp_path):
     """Test that local timeline is fetched when enabled"""
-    cfg = DummyConfig(str(tmp_path / "state.json"))
-    cfg.local_timeline_enabled = True
-    cfg.local_timeline_fetch_limit = 10
-    hype = Hype(cfg)
-    
-    # Mock bot client with local timeline
-    bot_client = MagicMock()
-    bot_client.timeline_local = MagicMock(return_value=[])
+    hype = make_hype(
+        tmp_path,
+        local_timeline_enabled=True,
+        local_timeline_fetch_limit=10,
+    )
+    
+    # Bot client with local timeline
+    bot_client = FakeClient()
     hype.client = bot_client
     
     hype.boost()
     
     # timeline_local should be called with the right limit
-    bot_client.timeline_local.assert_called_once_with(limit=10)
+    assert bot_client.timeline_limits == [10]
 
 
 def test_local_timeline_filters_old_posts(tmp_path):
     """Test that posts older than today are filtered out"""
-    cfg = DummyConfig(str(tmp_path / "state.json"))
-    cfg.local_timeline_enabled = True
-    cfg.local_timeline_fetch_limit = 20
-    cfg.local_timeline_boost_limit = 5
-    hype = Hype(cfg)
+    hype = make_hype(
+        tmp_path,
+        local_timeline_enabled=True,
+        local_timeline_fetch_limit=20,
+        local_timeline_boost_limit=5,
+    )
     
     # Create posts from different days
     now = datetime.now(timezone.utc)
-    today = now.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
-    yesterday = (now - timedelta(days=1)).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+    today = iso_z(now)
+    yesterday = iso_z(now - timedelta(days=1))
     
     local_posts = [
         {
@@ -115,32 +110,31 @@ def test_local_timeline_filters_old_posts(tmp_path):
         }
     ]
     
-    # Mock bot client
-    bot_client = MagicMock()
-    bot_client.timeline_local = MagicMock(return_value=local_posts)
-    bot_client.status_reblog = MagicMock()
+    # Bot client
+    bot_client = FakeClient(local_timeline=local_posts)
     hype.client = bot_client
     
     hype.boost()
     
     # Only today's post should be boosted
-    assert bot_client.status_reblog.call_count == 1
+    assert len(bot_client.reblogged) == 1
     # Verify it's the correct post (status object is passed, check its ID)
-    boosted_status = bot_client.status_reblog.call_args[0][0]
+    boosted_status = bot_client.reblogged[0]
     assert boosted_status["id"] == "1"
 
 
 def test_local_timeline_filters_low_engagement(tmp_path):
     """Test that posts without minimum engagement are filtered"""
-    cfg = DummyConfig(str(tmp_path / "state.json"))
-    cfg.local_timeline_enabled = True
-    cfg.local_timeline_fetch_limit = 20
-    cfg.local_timeline_boost_limit = 5
-    cfg.local_timeline_min_engagement = 3  # Require at least 3 total interactions
-    hype = Hype(cfg)
+    hype = make_hype(
+        tmp_path,
+        local_timeline_enabled=True,
+        local_timeline_fetch_limit=20,
+        local_timeline_boost_limit=5,
+        local_timeline_min_engagement=3,  # Require at least 3 total interactions
+    )
     
     now = datetime.now(timezone.utc)
-    today = now.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+    today = iso_z(now)
     
     local_posts = [
         {
@@ -169,30 +163,29 @@ def test_local_timeline_filters_low_engagement(tmp_path):
         }
     ]
     
-    # Mock bot client
-    bot_client = MagicMock()
-    bot_client.timeline_local = MagicMock(return_value=local_posts)
-    bot_client.status_reblog = MagicMock()
+    # Bot client
+    bot_client = FakeClient(local_timeline=local_posts)
     hype.client = bot_client
     
     hype.boost()
     
     # Only the post with enough engagement should be boosted
-    assert bot_client.status_reblog.call_count == 1
-    boosted_status = bot_client.status_reblog.call_args[0][0]
+    assert len(bot_client.reblogged) == 1
+    boosted_status = bot_client.reblogged[0]
     assert boosted_status["id"] == "2"
 
 
 def test_local_timeline_respects_boost_limit(tmp_path):
     """Test that local timeline respects its boost limit"""
-    cfg = DummyConfig(str(tmp_path / "state.json"))
-    cfg.local_timeline_enabled = True
-    cfg.local_timeline_fetch_limit = 20
-    cfg.local_timeline_boost_limit = 2  # Only boost 2 from local
-    hype = Hype(cfg)
+    hype = make_hype(
+        tmp_path,
+        local_timeline_enabled=True,
+        local_timeline_fetch_limit=20,
+        local_timeline_boost_limit=2,  # Only boost 2 from local
+    )
     
     now = datetime.now(timezone.utc)
-    today = now.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+    today = iso_z(now)
     
     # Create 4 qualifying posts from local timeline
     local_posts = []
@@ -210,33 +203,30 @@ def test_local_timeline_respects_boost_limit(tmp_path):
             "content": f"Post {i}"
         })
     
-    # Mock bot client
-    bot_client = MagicMock()
-    bot_client.timeline_local = MagicMock(return_value=local_posts)
-    bot_client.status_reblog = MagicMock()
+    # Bot client
+    bot_client = FakeClient(local_timeline=local_posts)
     hype.client = bot_client
     
     hype.boost()
     
     # Should only boost 2 posts (the limit)
-    assert bot_client.status_reblog.call_count == 2
+    assert len(bot_client.reblogged) == 2
 
 
 def test_local_timeline_with_remote_instances(tmp_path):
     """Test that local timeline works alongside remote instances"""
-    cfg = DummyConfig(str(tmp_path / "state.json"))
-    cfg.local_timeline_enabled = True
-    cfg.local_timeline_fetch_limit = 20
-    cfg.local_timeline_boost_limit = 1
-    
     # Add a remote instance
     inst = types.SimpleNamespace(name="remote.social", fetch_limit=20, boost_limit=1)
-    cfg.subscribed_instances = [inst]
-    
-    hype = Hype(cfg)
+    hype = make_hype(
+        tmp_path,
+        local_timeline_enabled=True,
+        local_timeline_fetch_limit=20,
+        local_timeline_boost_limit=1,
+        subscribed_instances=[inst],
+    )
     
     now = datetime.now(timezone.utc)
-    today = now.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+    today = iso_z(now)
     
     # Local timeline post
     local_posts = [{
@@ -266,18 +256,52 @@ def test_local_timeline_with_remote_instances(tmp_path):
         "content": "Remote post"
     }]
     
-    # Mock remote instance client
-    remote_mock = MagicMock()
-    remote_mock.trending_statuses.return_value = remote_posts
-    hype.init_client = MagicMock(return_value=remote_mock)
+    # Remote instance client
+    hype.init_client = MagicMock(return_value=stub_client(remote_posts))
     
-    # Mock bot client
-    bot_client = MagicMock()
-    bot_client.timeline_local = MagicMock(return_value=local_posts)
-    bot_client.status_reblog = MagicMock()
+    # Bot client
+    bot_client = FakeClient(local_timeline=local_posts)
     hype.client = bot_client
     
     hype.boost()
     
     # Should boost both (1 from local, 1 from remote)
-    assert bot_client.status_reblog.call_count == 2
+    assert len(bot_client.reblogged) == 2
+
+
+def test_local_timeline_is_fetched_alongside_remote_instances(tmp_path):
+    """The local timeline request overlaps the remote trending requests."""
+    inst = types.SimpleNamespace(name="remote.social", fetch_limit=20, boost_limit=1)
+    hype = make_hype(tmp_path, subscribed_instances=[inst])
+
+    # Each fetch waits for the other one, which only succeeds if both run at once
+    barrier = threading.Barrier(2, timeout=5)
+    today = iso_z(datetime.now(timezone.utc))
+    local = dict(status_data("local1", "https://local/1"), created_at=today, reblogs_count=1)
+    remote = dict(status_data("remote1", "https://remote/1"), account={"acct": "r@remote.social"})
+
+    class LocalClient(FakeClient):
+        def timeline_local(self, limit=None):
+            barrier.wait()
+            return [local]
+
+    def trending_statuses(limit=None):
+        barrier.wait()
+        return [remote]
+
+    hype.init_client = MagicMock(return_value=types.SimpleNamespace(trending_statuses=trending_statuses))
+    hype.client = LocalClient()
+
+    hype.boost()
+
+    assert {s["id"] for s in hype.client.reblogged} == {"local1", "remote1"}
+
+
+def test_local_timeline_not_fetched_without_boost_budget(tmp_path):
+    """A zero local boost limit makes no timeline_local request."""
+    hype = make_hype(tmp_path, local_timeline_boost_limit=0)
+    hype.client = FakeClient()
+
+    hype.boost()
+
+    assert hype.client.timeline_limits == []
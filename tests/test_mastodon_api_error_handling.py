@@ -1,14 +1,10 @@
-import sys
-from pathlib import Path
 import types
 from unittest.mock import MagicMock
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from hype.hype import Hype
-from tests.test_seen_status import DummyConfig, status_data
+from tests.helpers import DummyConfig, status_data, stub_client
 from mastodon.errors import MastodonInternalServerError, MastodonAPIError, MastodonNotFoundError
 
 
@@ -19,6 +15,7 @@ def test_handles_mastodon_internal_server_error_during_search(tmp_path):
     inst = types.SimpleNamespace(name="test_instance", limit=2)
     cfg.subscribed_instances = [inst]
     hype = Hype(cfg)
+    hype.SEARCH_RETRY_DELAY_SECONDS = 0
     
     # Mock trending statuses from remote instance
     trending = [
@@ -41,8 +38,7 @@ def test_handles_mastodon_internal_server_error_during_search(tmp_path):
     ]
     
     # Mock the remote instance client that fetches trending statuses
-    remote_client = MagicMock()
-    remote_client.trending_statuses.return_value = trending
+    remote_client = stub_client(trending)
     hype.init_client = MagicMock(return_value=remote_client)
     
     # Mock the bot's own client where search_v2 will fail
@@ -75,8 +71,8 @@ def test_handles_mastodon_internal_server_error_during_search(tmp_path):
     # and successfully boost the second status
     hype.boost()
     
-    # Verify that search_v2 was called twice (once for each status)
-    assert bot_client.search_v2.call_count == 2
+    # Verify that search_v2 was called three times (the 500 is retried once)
+    assert bot_client.search_v2.call_count == 3
     
     # Verify that reblog was attempted for each status (including retries)
     assert bot_client.status_reblog.call_count == 3
@@ -86,8 +82,21 @@ def test_handles_mastodon_internal_server_error_during_search(tmp_path):
     assert boosted_status["uri"] == "https://remote.instance/status/2"
 
 
-def test_handles_other_mastodon_api_errors_during_search(tmp_path):
-    """Test that other MastodonAPIError subclasses are also handled gracefully."""
+@pytest.mark.parametrize(
+    "search_error",
+    [
+        pytest.param(MastodonAPIError("Generic API error"), id="generic"),
+        pytest.param(
+            MastodonAPIError(
+                "Mastodon API returned error", 401, "Unauthorized",
+                "Search queries that resolve remote resources are not supported without authentication"
+            ),
+            id="401-unauthorized",
+        ),
+    ],
+)
+def test_handles_mastodon_api_errors_during_search(tmp_path, search_error):
+    """MastodonAPIError from search_v2, generic or 401 Unauthorized, skips the status."""
     cfg = DummyConfig(str(tmp_path / "state.json"))
     cfg.min_replies = 2
     inst = types.SimpleNamespace(name="test_instance", limit=1)
@@ -107,14 +116,13 @@ def test_handles_other_mastodon_api_errors_during_search(tmp_path):
     ]
     
     # Mock the remote instance client that fetches trending statuses
-    remote_client = MagicMock()
-    remote_client.trending_statuses.return_value = trending
+    remote_client = stub_client(trending)
     hype.init_client = MagicMock(return_value=remote_client)
     
-    # Mock the bot's own client where search_v2 will fail with a generic MastodonAPIError
+    # Mock the bot's own client where search_v2 will fail
     bot_client = MagicMock()
     bot_client.status_reblog.side_effect = MastodonNotFoundError("Not found")
-    bot_client.search_v2.side_effect = MastodonAPIError("Generic API error")
+    bot_client.search_v2.side_effect = search_error
     
     hype.client = bot_client
     
@@ -135,6 +143,7 @@ def test_continues_after_api_error_with_multiple_statuses(tmp_path):
     inst = types.SimpleNamespace(name="test_instance", limit=3)
     cfg.subscribed_instances = [inst]
     hype = Hype(cfg)
+    hype.SEARCH_RETRY_DELAY_SECONDS = 0
     
     # Mock trending statuses from remote instance
     trending = [
@@ -165,8 +174,7 @@ def test_continues_after_api_error_with_multiple_statuses(tmp_path):
     ]
     
     # Mock the remote instance client that fetches trending statuses
-    remote_client = MagicMock()
-    remote_client.trending_statuses.return_value = trending
+    remote_client = stub_client(trending)
     hype.init_client = MagicMock(return_value=remote_client)
     
     # Mock the bot's own client
@@ -202,8 +210,8 @@ def test_continues_after_api_error_with_multiple_statuses(tmp_path):
     # The boost cycle should complete without crashing
     hype.boost()
     
-    # Verify that search was attempted for all three statuses
-    assert bot_client.search_v2.call_count == 3
+    # Verify that search was attempted for all three statuses, retrying the 500 once
+    assert bot_client.search_v2.call_count == 4
     searched_uris = {call.args[0] for call in bot_client.search_v2.call_args_list}
     assert searched_uris == {
         "https://remote.instance/status/1",
@@ -215,46 +223,26 @@ def test_continues_after_api_error_with_multiple_statuses(tmp_path):
     assert bot_client.status_reblog.call_count == 5
 
 
-def test_handles_401_unauthorized_search_error(tmp_path):
-    """Test that 401 Unauthorized errors during search_v2 are handled gracefully."""
+def test_retries_federation_search_once_after_internal_server_error(tmp_path):
+    """A transient 500 from search_v2 is retried once and the status is still boosted."""
     cfg = DummyConfig(str(tmp_path / "state.json"))
-    cfg.min_replies = 2
-    inst = types.SimpleNamespace(name="test_instance", limit=1)
-    cfg.subscribed_instances = [inst]
+    cfg.subscribed_instances = [types.SimpleNamespace(name="test_instance", limit=1)]
     hype = Hype(cfg)
-    
-    # Mock trending statuses from remote instance
-    trending = [
-        {
-            "id": "remote-unauthorized",
-            "uri": "https://remote.instance/status/1",
-            "reblogs_count": 5,
-            "favourites_count": 10,
-            "created_at": "2024-01-01T00:00:00Z",
-            "replies_count": 2,
-        },
-    ]
-    
-    # Mock the remote instance client that fetches trending statuses
-    remote_client = MagicMock()
-    remote_client.trending_statuses.return_value = trending
-    hype.init_client = MagicMock(return_value=remote_client)
-    
-    # Mock the bot's own client where search_v2 will fail with 401 Unauthorized
+    hype.SEARCH_RETRY_DELAY_SECONDS = 0
+
+    trending = [status_data("remote-1", "https://remote.instance/status/1")]
+    hype.init_client = MagicMock(return_value=stub_client(trending))
+
+    resolved = status_data("1", "https://remote.instance/status/1")
     bot_client = MagicMock()
-    bot_client.status_reblog.side_effect = MastodonNotFoundError("Not found")
-    bot_client.search_v2.side_effect = MastodonAPIError(
-        "Mastodon API returned error", 401, "Unauthorized", 
-        "Search queries that resolve remote resources are not supported without authentication"
-    )
-    
+    bot_client.status_reblog.side_effect = [MastodonNotFoundError("Not found"), None]
+    bot_client.search_v2.side_effect = [
+        MastodonInternalServerError("Mastodon API returned error", 500, "Internal Server Error", None),
+        {"statuses": [resolved]},
+    ]
     hype.client = bot_client
-    
-    # The boost cycle should complete without crashing  
+
     hype.boost()
-    
-    # Verify that search_v2 was called once
-    assert bot_client.search_v2.call_count == 1
-    
-    # Verify that the reblog attempt was made but skipped after the 401 error
-    assert bot_client.status_reblog.call_count == 1
+
+    assert bot_client.search_v2.call_count == 2
+    assert bot_client.status_reblog.call_args.args[0] is resolved
@@ -1,14 +1,9 @@
-import sys
-import types
 import math
-from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from hype.hype import Hype
-from tests.test_seen_status import DummyConfig, status_data
+from tests.helpers import DummyConfig, status_data
 
 
 def test_min_replies_in_scoring(tmp_path):
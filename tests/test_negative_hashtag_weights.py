@@ -1,13 +1,10 @@
-import sys
 import math
-from pathlib import Path
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from hype.hype import Hype
-from tests.test_seen_status import DummyConfig, status_data
+from tests.helpers import DummyConfig, status_data
 
 
 def test_negative_hashtag_weights_reduce_score(tmp_path):
@@ -136,7 +133,6 @@ def test_unknown_hashtags_get_zero_score(tmp_path):
 
 def test_negative_hashtag_combined_with_age_decay(tmp_path):
     """Test negative hashtag weights work correctly with age decay."""
-    from datetime import datetime, timezone, timedelta
     
     cfg = DummyConfig(str(tmp_path / "state.json"))
     cfg.hashtag_scores = {"bad": -10}
@@ -1,12 +1,8 @@
-import sys
-from pathlib import Path
 from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from hype.hype import Hype
-from tests.test_seen_status import DummyConfig
+from tests.helpers import DummyConfig
 
 
 class FixedDatetime(datetime):
@@ -1,16 +1,10 @@
-import sys
 import types
-from pathlib import Path
 from unittest.mock import MagicMock
 
-import pytest
-
 from mastodon.errors import MastodonNotFoundError
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from hype.hype import Hype
-from tests.test_seen_status import DummyConfig, status_data
+from tests.helpers import DummyConfig, status_data, stub_client
 
 
 def test_quality_threshold_filters_low_scoring_posts(tmp_path):
@@ -51,8 +45,7 @@ def test_quality_threshold_filters_low_scoring_posts(tmp_path):
         },
     ]
     
-    m = MagicMock()
-    m.trending_statuses.return_value = trending
+    m = stub_client(trending)
     hype.init_client = MagicMock(return_value=m)
     
     client = MagicMock()
@@ -106,8 +99,7 @@ def test_quality_threshold_disabled_by_default(tmp_path):
         },
     ]
     
-    m = MagicMock()
-    m.trending_statuses.return_value = trending
+    m = stub_client(trending)
     hype.init_client = MagicMock(return_value=m)
     
     client = MagicMock()
@@ -157,8 +149,7 @@ def test_quality_threshold_skips_boost_cycle_when_no_qualifying_content(tmp_path
         },
     ]
     
-    m = MagicMock()
-    m.trending_statuses.return_value = trending
+    m = stub_client(trending)
     hype.init_client = MagicMock(return_value=m)
     
     client = MagicMock()
@@ -221,8 +212,7 @@ def test_quality_threshold_respects_raw_scores(tmp_path):
         },
     ]
     
-    m = MagicMock()
-    m.trending_statuses.return_value = trending
+    m = stub_client(trending)
     hype.init_client = MagicMock(return_value=m)
     
     client = MagicMock()
@@ -1,19 +1,12 @@
-import sys
 import math
-from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from tests.helpers import make_hype, status_data
 
-from hype.hype import Hype
-from tests.test_seen_status import DummyConfig, status_data
 
-
-def test_scores_hashtags_and_engagement(tmp_path):
-    cfg = DummyConfig(str(tmp_path / "state.json"))
-    cfg.hashtag_scores = {"python": 10}
-    hype = Hype(cfg)
+def test_scores_hashtags_and_engagement():
+    hype = make_hype(hashtag_scores={"python": 10})
     s = status_data("1", "https://a/1")
     s["tags"] = [{"name": "python"}]
     s["reblogs_count"] = 3
@@ -22,18 +15,15 @@ def test_scores_hashtags_and_engagement(tmp_path):
     assert hype.score_status(s) == pytest.approx(expected)
 
 
-def test_media_bonus(tmp_path):
-    cfg = DummyConfig(str(tmp_path / "state.json"))
-    cfg.prefer_media = 0.5
-    hype = Hype(cfg)
+def test_media_bonus():
+    hype = make_hype(prefer_media=0.5)
     s = status_data("1", "https://a/1")
     s["media_attachments"] = [1]
     assert hype.score_status(s) == pytest.approx(0.5)
 
 
-def test_no_media_bonus_without_preference(tmp_path):
-    cfg = DummyConfig(str(tmp_path / "state.json"))
-    hype = Hype(cfg)
+def test_no_media_bonus_without_preference():
+    hype = make_hype()
     s = status_data("1", "https://a/1")
     s["media_attachments"] = [1]
     assert hype.score_status(s) == 0
@@ -1,95 +1,21 @@
-import sys
+import json
 import types
-from pathlib import Path
+from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from hype.hype import Hype
+from tests.helpers import DummyConfig, FakeClient, boost_harness, status_data, stub_client
 
 
-class DummyConfig:
-    def __init__(self, path):
-        self.bot_account = types.SimpleNamespace(server="s", access_token="t")
-        self.log_level = "ERROR"
-        self.debug_decisions = False
-        self.logfile_path = ""
-        self.subscribed_instances = []
-        self.filtered_instances = []
-        self.profile_prefix = ""
-        self.fields = {}
-        self.daily_public_cap = 10
-        self.per_hour_public_cap = 10
-        self.max_boosts_per_run = 10
-        self.max_boosts_per_author_per_day = 10
-        self.author_diversity_enforced = False  # Disabled by default for tests
-        self.prefer_media = False
-        self.require_media = False
-        self.skip_sensitive_without_cw = False
-        self.min_reblogs = 0
-        self.min_favourites = 0
-        self.min_replies = 0
-        self.languages_allowlist = []
-        self.use_mastodon_language_detection = False  # Use langdetect by default
-        self.state_path = path
-        self.seen_cache_size = 6000
-        self.hashtag_scores = {}
-        # Add new configuration attributes
-        self.age_decay_enabled = False
-        self.age_decay_half_life_hours = 24.0
-        self.hashtag_diversity_enforced = False
-        self.max_boosts_per_hashtag_per_run = 1
-        # Spam detection configuration
-        self.spam_emoji_penalty = 0
-        self.spam_emoji_threshold = 2
-        self.spam_link_penalty = 0
-        # Quality threshold configuration
-        self.min_score_threshold = 0
-        # Related hashtag scoring configuration
-        self.related_hashtags = {}
-        # Local timeline configuration
-        self.local_timeline_enabled = True
-        self.local_timeline_fetch_limit = 20
-        self.local_timeline_boost_limit = 2
-        self.local_timeline_min_engagement = 1
-
-
-
-def status_data(i, u):
-    return {
-        "id": i,
-        "url": u,
-        "uri": u,
-        "reblogged": False,
-        "account": {"acct": "a@b"},
-        "media_attachments": [1],
-        "sensitive": False,
-        "spoiler_text": "",
-        "language": "en",
-        "content": "",  # Add content field for spam detection tests
-    }
-
-
-def test_skips_duplicates_across_instances(tmp_path):
-    cfg = DummyConfig(str(tmp_path / "state.json"))
-    inst1 = types.SimpleNamespace(name="i1", limit=1)
-    inst2 = types.SimpleNamespace(name="i2", limit=1)
-    cfg.subscribed_instances = [inst1, inst2]
-    hype = Hype(cfg)
-    client = MagicMock()
-    client.search_v2.side_effect = [
-        {"statuses": [status_data("1", "https://a/1")]},
-        {"statuses": [status_data("2", "https://a/1")]},
-    ]
-    hype.client = client
-    m1 = MagicMock()
-    m1.trending_statuses.return_value = [{"uri": "https://a/1"}]
-    m2 = MagicMock()
-    m2.trending_statuses.return_value = [{"uri": "https://a/1"}]
-    hype.init_client = MagicMock(side_effect=[m1, m2])
+def test_skips_duplicates_across_instances():
+    hype = boost_harness({
+        "i1": [status_data("1", "https://a/1")],
+        "i2": [status_data("2", "https://a/1")],
+    })
     hype.boost()
-    assert client.status_reblog.call_count == 1
-    assert list(hype._seen).count("https://a/1") == 1
+    assert len(hype.client.reblogged) == 1
+    assert hype._seen.count("https://a/1") == 1
+    assert hype._seen_index["https://a/1"] == 1
 
 
 def test_seen_cache_respects_size(tmp_path):
@@ -99,6 +25,9 @@ def test_seen_cache_respects_size(tmp_path):
     hype._remember_status(status_data("1", "https://a/1"))
     hype._remember_status(status_data("2", "https://a/2"))
     assert list(hype._seen) == ["2", "https://a/2"]
+    # Evicted entries are no longer treated as seen
+    assert not hype._seen_status(status_data("1", "https://a/1"))
+    assert hype._seen_status(status_data("2", "https://a/2"))
 
 
 def test_respects_author_daily_limit(tmp_path):
@@ -180,7 +109,6 @@ def test_author_24hour_enforcement_different_authors(tmp_path):
 
 def test_author_24hour_enforcement_expired(tmp_path):
     """Test that author can be boosted again after 24 hours"""
-    import time
     cfg = DummyConfig(str(tmp_path / "state.json"))
     cfg.author_diversity_enforced = True
     hype = Hype(cfg)
@@ -190,7 +118,6 @@ def test_author_24hour_enforcement_expired(tmp_path):
     hype._remember_status(first)
     
     # Simulate 24 hours passing by manipulating the timestamp
-    from datetime import datetime, timezone
     now = datetime.now(timezone.utc).timestamp()
     expired_timestamp = now - (24 * 60 * 60 + 1)  # 24 hours and 1 second ago
     hype.state["author_boost_timestamps"]["a@b"] = expired_timestamp
@@ -217,7 +144,6 @@ def test_author_24hour_enforcement_disabled(tmp_path):
 
 def test_author_timestamp_cleanup(tmp_path):
     """Test that old author timestamps are cleaned up during save"""
-    from datetime import datetime, timezone
     cfg = DummyConfig(str(tmp_path / "state.json"))
     cfg.author_diversity_enforced = True
     hype = Hype(cfg)
@@ -234,7 +160,6 @@ def test_author_timestamp_cleanup(tmp_path):
     hype._save_state()
     
     # Reload state
-    import json
     with open(str(tmp_path / "state.json"), "r") as f:
         saved_state = json.load(f)
     
@@ -242,3 +167,59 @@ def test_author_timestamp_cleanup(tmp_path):
     assert "old@author" not in saved_state["author_boost_timestamps"]
     assert "recent@author" in saved_state["author_boost_timestamps"]
 
+
+
+def test_previously_seen_statuses_are_not_scored(tmp_path):
+    cfg = DummyConfig(str(tmp_path / "state.json"))
+    cfg.local_timeline_enabled = False
+    cfg.subscribed_instances = [types.SimpleNamespace(name="i1", limit=5)]
+    hype = Hype(cfg)
+    hype._remember_status(status_data("1", "https://a/1"))
+    hype.client = MagicMock()
+    m = stub_client([
+        status_data("1", "https://a/1"),
+        status_data("2", "https://a/2"),
+    ])
+    hype.init_client = MagicMock(return_value=m)
+    hype.score_status = MagicMock(return_value=1.0)
+    hype.boost()
+    scored = [c.args[0]["id"] for c in hype.score_status.call_args_list]
+    assert scored == ["2"]
+
+
+def test_post_trending_on_several_instances_is_scored_once(tmp_path):
+    cfg = DummyConfig(str(tmp_path / "state.json"))
+    cfg.local_timeline_enabled = False
+    cfg.subscribed_instances = [
+        types.SimpleNamespace(name="i1", limit=5),
+        types.SimpleNamespace(name="i2", limit=5),
+    ]
+    hype = Hype(cfg)
+    quiet = dict(status_data("a1", "https://a/1"), reblogs_count=1)
+    busy = dict(status_data("b1", "https://a/1"), reblogs_count=9)
+    clients = {"i1": stub_client([quiet]), "i2": stub_client([busy])}
+    hype.init_client = lambda name: clients[name]
+    hype.client = FakeClient()
+    hype.score_status = MagicMock(return_value=1.0)
+    hype.boost()
+    scored = [c.args[0]["id"] for c in hype.score_status.call_args_list]
+    assert scored == ["b1"]
+    assert [s["id"] for s in hype.client.reblogged] == ["b1"]
+
+
+def test_duplicate_falls_back_to_copy_from_instance_with_budget(tmp_path):
+    cfg = DummyConfig(str(tmp_path / "state.json"))
+    cfg.local_timeline_enabled = False
+    cfg.subscribed_instances = [
+        types.SimpleNamespace(name="i1", fetch_limit=5, boost_limit=1),
+        types.SimpleNamespace(name="i2", fetch_limit=5, boost_limit=0),
+    ]
+    hype = Hype(cfg)
+    quiet = dict(status_data("a1", "https://a/1"), reblogs_count=1)
+    busy = dict(status_data("b1", "https://a/1"), reblogs_count=9)
+    clients = {"i1": stub_client([quiet]), "i2": stub_client([busy])}
+    hype.init_client = lambda name: clients[name]
+    hype.client = FakeClient()
+    hype.score_status = MagicMock(return_value=1.0)
+    hype.boost()
+    assert [s["id"] for s in hype.client.reblogged] == ["a1"]
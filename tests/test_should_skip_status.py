@@ -1,11 +1,6 @@
-import sys
-from pathlib import Path
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
-from hype.hype import Hype
-from tests.test_seen_status import DummyConfig, status_data
+from tests.helpers import make_hype, status_data
 
 
 @pytest.mark.parametrize(
@@ -38,12 +33,27 @@ from tests.test_seen_status import DummyConfig, status_data
         ({"min_favourites": 4}, {"favourites_count": 3}, True),
         ({"min_favourites": 4}, {"favourites_count": 4}, False),
     ],
+    ids=[
+        "require_media_empty",
+        "require_media_present",
+        "sensitive_no_cw",
+        "sensitive_with_cw",
+        "lang_block",
+        "lang_allow",
+        "lang_none_blocked",
+        "lang_empty_blocked",
+        "lang_nl_blocked",
+        "no_allowlist_fr",
+        "no_allowlist_none",
+        "no_allowlist_empty",
+        "min_reblogs_low",
+        "min_reblogs_ok",
+        "min_fav_low",
+        "min_fav_ok",
+    ],
 )
 def test_should_skip_status(tmp_path, cfg_updates, status_updates, expected):
-    cfg = DummyConfig(str(tmp_path / "state.json"))
-    for k, v in cfg_updates.items():
-        setattr(cfg, k, v)
-    hype = Hype(cfg)
+    hype = make_hype(tmp_path, **cfg_updates)
     s = status_data("1", "https://a/1")
     s.update(status_updates)
     assert hype._should_skip_status(s) is expected
@@ -1,62 +1,54 @@
-import sys
 import math
-from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from hype.hype import Hype
-from tests.test_seen_status import DummyConfig, status_data
-
-
-def test_emoji_count_detection():
+from tests.helpers import DummyConfig, make_hype, status_data
+
+
+@pytest.fixture(scope="module")
+def default_hype():
+    """Default-config Hype shared by the pure helper tests below."""
+    return make_hype()
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        pytest.param("", 0, id="empty"),
+        pytest.param("Hello world", 0, id="no-emoji"),
+        pytest.param("Hello 😀", 1, id="single-trailing"),
+        pytest.param("😀 Hello", 1, id="single-leading"),
+        pytest.param("😀😁😂", 3, id="adjacent"),
+        pytest.param("Hello 😀 world 😁 test 😂", 3, id="spread"),
+        pytest.param("Check this out! 🎉🎊🚀 Amazing!", 3, id="mixed-content"),
+    ],
+)
+def test_emoji_count_detection(default_hype, text, expected):
     """Test emoji counting function works correctly."""
-    cfg = DummyConfig("/tmp/state.json")
-    hype = Hype(cfg)
-    
-    # Test with no emojis
-    assert hype._count_emojis("") == 0
-    assert hype._count_emojis("Hello world") == 0
-    
-    # Test with single emoji
-    assert hype._count_emojis("Hello 😀") == 1
-    assert hype._count_emojis("😀 Hello") == 1
-    
-    # Test with multiple emojis
-    assert hype._count_emojis("😀😁😂") == 3
-    assert hype._count_emojis("Hello 😀 world 😁 test 😂") == 3
-    
-    # Test with mixed content
-    assert hype._count_emojis("Check this out! 🎉🎊🚀 Amazing!") == 3
-
-
-def test_link_detection():
+    assert default_hype._count_emojis(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        pytest.param("", False, id="empty"),
+        pytest.param("Hello world", False, id="no-link"),
+        pytest.param("Check out https://example.com", True, id="https"),
+        pytest.param("Visit https://www.example.com/path", True, id="https-www-path"),
+        pytest.param("Go to http://example.com", True, id="http"),
+        pytest.param("Visit www.example.com", True, id="bare-www"),
+        pytest.param("Visit https://example.com and www.test.com", True, id="several"),
+    ],
+)
+def test_link_detection(default_hype, text, expected):
     """Test link detection function works correctly."""
-    cfg = DummyConfig("/tmp/state.json")
-    hype = Hype(cfg)
-    
-    # Test with no links
-    assert not hype._has_links("")
-    assert not hype._has_links("Hello world")
-    
-    # Test with HTTP links
-    assert hype._has_links("Check out https://example.com")
-    assert hype._has_links("Visit https://www.example.com/path")
-    
-    # Test with HTTPS links
-    assert hype._has_links("Go to http://example.com")
-    
-    # Test with www links
-    assert hype._has_links("Visit www.example.com")
-    
-    # Test with multiple links
-    assert hype._has_links("Visit https://example.com and www.test.com")
+    assert default_hype._has_links(text) is expected
 
 
-def test_no_spam_penalty_by_default(tmp_path):
+def test_no_spam_penalty_by_default():
     """Test that spam penalties are disabled by default."""
-    cfg = DummyConfig(str(tmp_path / "state.json"))
+    cfg = DummyConfig()
     # Default spam penalties should be 0
     assert cfg.spam_emoji_penalty == 0
     assert cfg.spam_link_penalty == 0
@@ -71,12 +63,12 @@ def test_no_spam_penalty_by_default(tmp_path):
     assert base_score == 0  # No hashtags, reblogs, favourites, etc.
 
 
-def test_emoji_spam_penalty(tmp_path):
+def test_emoji_spam_penalty():
     """Test emoji spam penalty reduces score."""
-    cfg = DummyConfig(str(tmp_path / "state.json"))
-    cfg.spam_emoji_penalty = 1.0  # 1 point penalty per excess emoji
-    cfg.spam_emoji_threshold = 2  # Penalty starts after 2 emojis
-    hype = Hype(cfg)
+    hype = make_hype(
+        spam_emoji_penalty=1.0,  # 1 point penalty per excess emoji
+        spam_emoji_threshold=2,  # Penalty starts after 2 emojis
+    )
     
     # Test no penalty for 2 emojis or less
     s1 = status_data("1", "https://a/1")
@@ -101,11 +93,11 @@ def test_emoji_spam_penalty(tmp_path):
     assert score4 == -3.0
 
 
-def test_link_penalty(tmp_path):
+def test_link_penalty():
     """Test link penalty reduces score."""
-    cfg = DummyConfig(str(tmp_path / "state.json"))
-    cfg.spam_link_penalty = 0.5  # 0.5 point penalty for links
-    hype = Hype(cfg)
+    hype = make_hype(
+        spam_link_penalty=0.5,  # 0.5 point penalty for links
+    )
     
     # Test no penalty without links
     s1 = status_data("1", "https://a/1")
@@ -120,13 +112,13 @@ def test_link_penalty(tmp_path):
     assert score2 == -0.5
 
 
-def test_combined_spam_penalties(tmp_path):
+def test_combined_spam_penalties():
     """Test that emoji and link penalties combine."""
-    cfg = DummyConfig(str(tmp_path / "state.json"))
-    cfg.spam_emoji_penalty = 1.0
-    cfg.spam_emoji_threshold = 2
-    cfg.spam_link_penalty = 0.5
-    hype = Hype(cfg)
+    hype = make_hype(
+        spam_emoji_penalty=1.0,
+        spam_emoji_threshold=2,
+        spam_link_penalty=0.5,
+    )
     
     s = status_data("1", "https://a/1")
     s["content"] = "😀😁😂😃 Check this out! https://example.com"  # 4 emojis (2 excess) + link
@@ -136,14 +128,14 @@ def test_combined_spam_penalties(tmp_path):
     assert score == -2.5
 
 
-def test_spam_penalty_with_positive_score(tmp_path):
+def test_spam_penalty_with_positive_score():
     """Test spam penalties work with positive base scores."""
-    cfg = DummyConfig(str(tmp_path / "state.json"))
-    cfg.spam_emoji_penalty = 1.0
-    cfg.spam_emoji_threshold = 2
-    cfg.spam_link_penalty = 0.5
-    cfg.hashtag_scores = {"python": 10}
-    hype = Hype(cfg)
+    hype = make_hype(
+        spam_emoji_penalty=1.0,
+        spam_emoji_threshold=2,
+        spam_link_penalty=0.5,
+        hashtag_scores={"python": 10},
+    )
     
     s = status_data("1", "https://a/1")
     s["tags"] = [{"name": "python"}]
@@ -157,12 +149,12 @@ def test_spam_penalty_with_positive_score(tmp_path):
     assert score == pytest.approx(expected_base)
 
 
-def test_configurable_emoji_threshold(tmp_path):
+def test_configurable_emoji_threshold():
     """Test that emoji threshold is configurable."""
-    cfg = DummyConfig(str(tmp_path / "state.json"))
-    cfg.spam_emoji_penalty = 1.0
-    cfg.spam_emoji_threshold = 1  # Penalty starts after 1 emoji
-    hype = Hype(cfg)
+    hype = make_hype(
+        spam_emoji_penalty=1.0,
+        spam_emoji_threshold=1,  # Penalty starts after 1 emoji
+    )
     
     # Test no penalty for 1 emoji
     s1 = status_data("1", "https://a/1")
@@ -177,12 +169,9 @@ def test_configurable_emoji_threshold(tmp_path):
     assert score2 == -1.0
 
 
-def test_spam_detection_handles_missing_content(tmp_path):
+def test_spam_detection_handles_missing_content():
     """Test spam detection handles missing or None content gracefully."""
-    cfg = DummyConfig(str(tmp_path / "state.json"))
-    cfg.spam_emoji_penalty = 1.0
-    cfg.spam_link_penalty = 0.5
-    hype = Hype(cfg)
+    hype = make_hype(spam_emoji_penalty=1.0, spam_link_penalty=0.5)
     
     # Test with None content
     s1 = status_data("1", "https://a/1")
@@ -201,4 +190,15 @@ def test_spam_detection_handles_missing_content(tmp_path):
     s3 = status_data("3", "https://a/3")
     s3["content"] = ""
     score3 = hype.score_status(s3)
-    assert score3 == 0
\ No newline at end of file
+    assert score3 == 0
+
+
+def test_spam_scans_skipped_when_penalties_are_off(monkeypatch):
+    """With both penalties at zero the content is never scanned for emojis or links."""
+    monkeypatch.setattr(Hype, "_count_emojis", lambda self, text: pytest.fail("emoji scan"))
+    monkeypatch.setattr(Hype, "_has_links", lambda self, text: pytest.fail("link scan"))
+    hype = make_hype()
+
+    s = status_data("1", "https://a/1")
+    s["content"] = "😀😁😂😃😄 Check out https://example.com"
+    assert hype.score_status(s) == 0
@@ -0,0 +1,167 @@
+import json
+import types
+from unittest.mock import MagicMock
+
+import pytest
+
+from hype.hype import Hype
+from tests.helpers import DummyConfig, status_data, stub_client
+
+
+def _boost(hype, status):
+    hype._count_public_boost()
+    hype._remember_status(status)
+    hype._log_boost(status)
+
+
+def test_boost_appends_to_log_without_rewriting_state(tmp_path):
+    """A boost appends one event to the state log and leaves state.json alone."""
+    cfg = DummyConfig(str(tmp_path / "state.json"))
+    hype = Hype(cfg)
+    _boost(hype, status_data("1", "https://a/1"))
+
+    assert not (tmp_path / "state.json").exists()
+    lines = (tmp_path / "state.json.log").read_text().splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["seen"] == ["1", "https://a/1"]
+
+
+def test_state_log_is_replayed_on_startup(tmp_path):
+    """Events in the state log are applied over the last checkpoint on load."""
+    cfg = DummyConfig(str(tmp_path / "state.json"))
+    hype = Hype(cfg)
+    hype._save_state()
+    _boost(hype, status_data("1", "https://a/1"))
+    _boost(hype, status_data("2", "https://a/2"))
+
+    restored = Hype(cfg)
+    assert list(restored._seen) == ["1", "https://a/1", "2", "https://a/2"]
+    assert restored.state["day_count"] == 2
+    assert restored.state["hour_count"] == 2
+    assert "a@b" in restored.state["author_boost_timestamps"]
+
+
+def test_state_log_ignores_torn_final_line(tmp_path):
+    """A partially written last event does not prevent loading the rest."""
+    cfg = DummyConfig(str(tmp_path / "state.json"))
+    hype = Hype(cfg)
+    _boost(hype, status_data("1", "https://a/1"))
+    with open(tmp_path / "state.json.log", "a") as handle:
+        handle.write('{"seen": ["2"')
+
+    restored = Hype(cfg)
+    assert list(restored._seen) == ["1", "https://a/1"]
+
+
+def test_checkpoint_truncates_state_log(tmp_path):
+    """Saving the full state folds the log in and removes it."""
+    cfg = DummyConfig(str(tmp_path / "state.json"))
+    hype = Hype(cfg)
+    hype.STATE_LOG_CHECKPOINT = 2
+    _boost(hype, status_data("1", "https://a/1"))
+    assert (tmp_path / "state.json.log").exists()
+    _boost(hype, status_data("2", "https://a/2"))
+
+    assert not (tmp_path / "state.json.log").exists()
+    with open(tmp_path / "state.json") as handle:
+        saved = json.load(handle)
+    assert saved["seen_status_ids"] == ["1", "https://a/1", "2", "https://a/2"]
+    assert list(Hype(cfg)._seen) == ["1", "https://a/1", "2", "https://a/2"]
+
+
+def test_boost_cycle_does_not_rewrite_state_file(tmp_path):
+    """Boosts below the checkpoint threshold only touch the state log."""
+    cfg = DummyConfig(str(tmp_path / "state.json"))
+    cfg.local_timeline_enabled = False
+    cfg.subscribed_instances = [types.SimpleNamespace(name="i1", limit=2)]
+    hype = Hype(cfg)
+    m = stub_client([
+        status_data("1", "https://a/1"),
+        status_data("2", "https://a/2"),
+    ])
+    hype.init_client = MagicMock(return_value=m)
+    hype.client = MagicMock()
+
+    hype.boost()
+
+    assert hype.client.status_reblog.call_count == 2
+    assert not (tmp_path / "state.json").exists()
+    assert len((tmp_path / "state.json.log").read_text().splitlines()) == 2
+    assert list(Hype(cfg)._seen) == ["1", "https://a/1", "2", "https://a/2"]
+
+
+def test_empty_state_path_keeps_state_in_memory(tmp_path, monkeypatch):
+    """With no state_path nothing is written, but the run still tracks boosts."""
+    monkeypatch.chdir(tmp_path)
+    cfg = DummyConfig("")
+    hype = Hype(cfg)
+    hype.STATE_LOG_CHECKPOINT = 1
+    _boost(hype, status_data("1", "https://a/1"))
+    hype._save_state()
+
+    assert list(tmp_path.iterdir()) == []
+    assert hype._seen_status(status_data("1", "https://a/1"))
+    assert hype.state["day_count"] == 1
+
+
+def test_log_left_behind_by_checkpoint_is_not_replayed_twice(tmp_path):
+    """A crash between writing state.json and removing the log doesn't double-count."""
+    cfg = DummyConfig(str(tmp_path / "state.json"))
+    hype = Hype(cfg)
+    _boost(hype, status_data("1", "https://a/1"))
+    _boost(hype, status_data("2", "https://a/2"))
+    stale_log = (tmp_path / "state.json.log").read_text()
+    hype._save_state()
+    # The process died before the log was removed
+    (tmp_path / "state.json.log").write_text(stale_log)
+
+    restored = Hype(cfg)
+    assert list(restored._seen) == ["1", "https://a/1", "2", "https://a/2"]
+    assert restored.state["day_count"] == 2
+    assert restored.state["hour_count"] == 2
+    assert restored._boosted_today == {"a@b": 2}
+
+    # New events after the restart are still replayed
+    _boost(restored, status_data("3", "https://a/3"))
+    assert Hype(cfg).state["day_count"] == 3
+
+
+def test_failed_checkpoint_keeps_previous_state_and_log(tmp_path, monkeypatch):
+    """If the checkpoint can't be swapped in, state.json and the log stay usable."""
+    cfg = DummyConfig(str(tmp_path / "state.json"))
+    hype = Hype(cfg)
+    _boost(hype, status_data("1", "https://a/1"))
+    hype._save_state()
+    _boost(hype, status_data("2", "https://a/2"))
+
+    def crash(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("hype.hype.os.replace", crash)
+    hype._save_state()
+    monkeypatch.undo()
+
+    with open(tmp_path / "state.json") as handle:
+        assert json.load(handle)["seen_status_ids"] == ["1", "https://a/1"]
+    restored = Hype(cfg)
+    assert list(restored._seen) == ["1", "https://a/1", "2", "https://a/2"]
+    assert restored.state["day_count"] == 2
+
+
+def test_start_saves_state_on_shutdown(tmp_path, monkeypatch):
+    """Leaving the scheduler loop folds the state log into state.json."""
+    monkeypatch.setattr("hype.hype.signal.signal", lambda signum, handler: None)
+    cfg = DummyConfig(str(tmp_path / "state.json"))
+    hype = Hype(cfg)
+    _boost(hype, status_data("1", "https://a/1"))
+
+    def interrupted():
+        raise KeyboardInterrupt
+
+    hype.boost = interrupted
+    with pytest.raises(KeyboardInterrupt):
+        hype.start()
+
+    assert not (tmp_path / "state.json.log").exists()
+    with open(tmp_path / "state.json") as handle:
+        assert json.load(handle)["seen_status_ids"] == ["1", "https://a/1"]